@@ -251,8 +251,8 @@ def test_database():
         traceback.print_exc()
         return False
 
-def test_full_pipeline():
-    """Test the complete ETL pipeline"""
+def test_full_pipeline(extracted=None):
+    """Test the complete ETL pipeline, reusing already fetched (weather_data, air_data) if given"""
     print("\n🚀 Testing Complete ETL Pipeline...")
     
     try:
@@ -267,7 +267,8 @@ def test_full_pipeline():
             longitude=lon,
             save_to_db=True,
             save_to_csv=False,
-            display_summary=True
+            display_summary=True,
+            extracted=extracted
         )
         
         if success:
@@ -338,8 +339,8 @@ def main():
         print("\n❌ Database test failed.")
         return False
     
-    # Test 7: Full pipeline
-    if not test_full_pipeline():
+    # Test 7: Full pipeline (same coordinates as Test 4, so skip re-fetching)
+    if not test_full_pipeline(extracted=(weather_data, air_data)):
         print("\n❌ Full pipeline test failed.")
         return False
     
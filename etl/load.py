@@ -11,7 +11,14 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+# Faster JSON encoding when available; the stdlib json module is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -108,8 +115,14 @@ class WeatherLoader:
             }
             
             # Save to JSON with proper formatting
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, default=str, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                # Datetimes go through default=str so output matches the json path
+                options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(json_data, default=str, option=options))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(json_data, f, indent=2, default=str, ensure_ascii=False)
             
             logger.info(f"Data successfully saved to JSON: {filepath}")
             return str(filepath)
@@ -144,32 +157,20 @@ class WeatherLoader:
                 
                 cursor = conn.cursor()
                 
-                # Process each record individually to handle duplicates
-                inserted_count = 0
-                updated_count = 0
+                # Single upsert statement for the whole batch; rows already present
+                # for (date, latitude, longitude) get their data columns refreshed
+                sql, rows = self._build_upsert(table_name)
                 
-                for _, record in self.data.iterrows():
-                    try:
-                        # Try to insert the record first
-                        self._insert_record(cursor, record, table_name)
-                        inserted_count += 1
-                        
-                    except sqlite3.IntegrityError as e:
-                        if "UNIQUE constraint failed" in str(e):
-                            # Record exists, update it instead
-                            if self._update_record(cursor, record, table_name):
-                                updated_count += 1
-                                logger.debug(f"Updated existing record for {record.get('date')} at {record.get('latitude')}, {record.get('longitude')}")
-                            else:
-                                logger.warning(f"Failed to update record for {record.get('date')}")
-                        else:
-                            # Different integrity error - re-raise
-                            logger.error(f"Integrity error: {e}")
-                            raise e
+                count_sql = f"SELECT COUNT(*) FROM {table_name}"
+                rows_before = cursor.execute(count_sql).fetchone()[0]
+                cursor.executemany(sql, rows)
+                rows_after = cursor.execute(count_sql).fetchone()[0]
                 
                 conn.commit()
                 
-                total_processed = inserted_count + updated_count
+                total_processed = len(rows)
+                inserted_count = rows_after - rows_before
+                updated_count = total_processed - inserted_count
                 logger.info(f"Successfully processed {total_processed} records to SQLite: {db_path}")
                 logger.info(f"  - Inserted: {inserted_count} new records")
                 logger.info(f"  - Updated: {updated_count} existing records")
@@ -183,14 +184,15 @@ class WeatherLoader:
             logger.error(f"Failed to save data to SQLite: {e}")
             return False
 
-    def _insert_record(self, cursor: sqlite3.Cursor, record: pd.Series, table_name: str) -> None:
+    def _build_upsert(self, table_name: str) -> Tuple[str, List[List[Any]]]:
         """
-        Insert a single record into the database
+        Build the INSERT ... ON CONFLICT statement and its parameter rows
         
         Args:
-            cursor: Database cursor
-            record: Single record to insert
             table_name: Target table name
+            
+        Returns:
+            Tuple of (SQL statement, list of parameter rows)
         """
         # Define the column mapping
         columns = [
@@ -202,26 +204,38 @@ class WeatherLoader:
             'measurement_time', 'last_updated', 'created_at', 'data_source'
         ]
         
-        # Prepare values (handle missing columns)
-        values = []
+        # Define updatable columns (excluding key columns and timestamps)
+        update_columns = [
+            'current_temp_c', 'current_condition', 'wind_kph', 'wind_dir',
+            'forecast_max_temp', 'forecast_min_temp', 'precipitation_mm',
+            'uv_index', 'weather_code', 'forecast_condition',
+            'pm2_5', 'pm10', 'us_aqi', 'european_aqi', 'aqi_category',
+            'timezone', 'elevation', 'measurement_time'
+        ]
+        
+        n_rows = len(self.data)
+        now = datetime.now().isoformat()
+        
+        # Column-wise conversion to native Python values (NaN -> NULL),
+        # with defaults for missing columns
+        column_values = []
         for col in columns:
-            if col in record.index:
-                value = record[col]
-                # Handle NaN values
-                if pd.isna(value):
-                    values.append(None)
-                else:
-                    values.append(value)
+            if col in self.data.columns:
+                series = self.data[col]
+                column_values.append(series.astype(object).where(series.notna(), None).tolist())
+            elif col == 'created_at':
+                column_values.append([now] * n_rows)
+            elif col == 'data_source':
+                column_values.append(['open-meteo'] * n_rows)
             else:
-                # Provide defaults for missing columns
-                if col == 'created_at':
-                    values.append(datetime.now().isoformat())
-                elif col == 'data_source':
-                    values.append('open-meteo')
-                else:
-                    values.append(None)
+                column_values.append([None] * n_rows)
+        
+        # last_updated is bound once more for the update branch
+        rows = [list(row) + [now] for row in zip(*column_values)]
+        
+        set_clauses = [f"{col} = excluded.{col}" for col in update_columns if col in self.data.columns]
+        set_clauses.append("last_updated = ?")
         
-        # Create the INSERT SQL
         placeholders = ', '.join(['?' for _ in columns])
         column_names = ', '.join(columns)
         
@@ -229,61 +243,10 @@ class WeatherLoader:
             INSERT INTO {table_name} 
             ({column_names})
             VALUES ({placeholders})
+            ON CONFLICT(date, latitude, longitude) DO UPDATE SET {', '.join(set_clauses)}
         """
         
-        cursor.execute(sql, values)
-
-    def _update_record(self, cursor: sqlite3.Cursor, record: pd.Series, table_name: str) -> bool:
-        """
-        Update an existing record in the database
-        
-        Args:
-            cursor: Database cursor
-            record: Record data to update
-            table_name: Target table name
-            
-        Returns:
-            bool: True if update was successful
-        """
-        try:
-            # Define updatable columns (excluding key columns and timestamps)
-            update_columns = [
-                'current_temp_c', 'current_condition', 'wind_kph', 'wind_dir',
-                'forecast_max_temp', 'forecast_min_temp', 'precipitation_mm',
-                'uv_index', 'weather_code', 'forecast_condition',
-                'pm2_5', 'pm10', 'us_aqi', 'european_aqi', 'aqi_category',
-                'timezone', 'elevation', 'measurement_time'
-            ]
-            
-            # Build SET clause
-            set_clauses = []
-            values = []
-            
-            for col in update_columns:
-                if col in record.index:
-                    set_clauses.append(f"{col} = ?")
-                    value = record[col]
-                    values.append(None if pd.isna(value) else value)
-            
-            # Add last_updated timestamp
-            set_clauses.append("last_updated = ?")
-            values.append(datetime.now().isoformat())
-            
-            # Add WHERE clause values
-            values.extend([record['date'], record['latitude'], record['longitude']])
-            
-            sql = f"""
-                UPDATE {table_name} 
-                SET {', '.join(set_clauses)}
-                WHERE date = ? AND latitude = ? AND longitude = ?
-            """
-            
-            cursor.execute(sql, values)
-            return cursor.rowcount > 0
-            
-        except Exception as e:
-            logger.error(f"Failed to update record: {e}")
-            return False
+        return sql, rows
 
     def save_all_formats(self, base_filename: Optional[str] = None) -> Dict[str, Optional[str]]:
         """
@@ -8,6 +8,7 @@ import time
 import os
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Dict, Any, List
 
 from .extract import WeatherExtractor
@@ -52,7 +53,9 @@ class WeatherETLPipeline:
             save_to_db: bool = True, 
             save_to_csv: bool = True, 
             save_to_json: bool = False,
-            display_summary: bool = True) -> bool:
+            display_summary: bool = True,
+            extracted: Optional[Tuple[Optional[Dict], Optional[Dict]]] = None,
+            extract_time: Optional[float] = None) -> bool:
         """
         Run the complete ETL pipeline
         
@@ -63,6 +66,8 @@ class WeatherETLPipeline:
             save_to_csv: Save data to CSV file
             save_to_json: Save data to JSON file
             display_summary: Display execution summary
+            extracted: Already fetched (weather_data, air_data); skips the API calls
+            extract_time: Seconds spent fetching `extracted`, reported as this run's extract time
             
         Returns:
             bool: True if pipeline completed successfully
@@ -81,7 +86,11 @@ class WeatherETLPipeline:
             logger.info("STEP 1: DATA EXTRACTION")
             logger.info("-"*40)
             
-            weather_data, air_data = self._extract_data(latitude, longitude)
+            if extracted is None:
+                weather_data, air_data = self._extract_data(latitude, longitude)
+            else:
+                weather_data, air_data = extracted
+                self.execution_stats['extract_time'] = extract_time or 0.0
             if not weather_data or not air_data:
                 logger.error("Data extraction failed - pipeline terminated")
                 return False
@@ -130,14 +139,20 @@ class WeatherETLPipeline:
 
     def run_batch(self, locations: List[Tuple[float, float]], 
                   save_to_db: bool = True, 
-                  save_to_csv: bool = True) -> Dict[str, Any]:
+                  save_to_csv: bool = True,
+                  max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Run ETL pipeline for multiple locations
         
+        Extraction is network-bound, so all locations are fetched concurrently
+        first; transform and load then run one location at a time to keep
+        SQLite and CSV writes serial.
+        
         Args:
             locations: List of (latitude, longitude) tuples
             save_to_db: Save data to database
             save_to_csv: Save data to CSV
+            max_workers: Threads used for extraction (defaults to one per location, capped at 8)
             
         Returns:
             Dict: Batch execution summary
@@ -148,7 +163,11 @@ class WeatherETLPipeline:
         
         logger.info(f"Starting batch ETL for {len(locations)} locations")
         
-        for i, (lat, lon) in enumerate(locations, 1):
+        workers = max_workers or min(8, len(locations)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            extracted_data = list(executor.map(lambda loc: self._fetch_data(*loc), locations))
+        
+        for i, ((lat, lon), (weather_data, air_data, extract_time)) in enumerate(zip(locations, extracted_data), 1):
             logger.info(f"\nProcessing location {i}/{len(locations)}: {lat}, {lon}")
             
             try:
@@ -157,7 +176,9 @@ class WeatherETLPipeline:
                     longitude=lon,
                     save_to_db=save_to_db,
                     save_to_csv=save_to_csv,
-                    display_summary=False  # Don't show summary for each location
+                    display_summary=False,  # Don't show summary for each location
+                    extracted=(weather_data, air_data),
+                    extract_time=extract_time
                 )
                 
                 if success:
@@ -200,6 +221,23 @@ class WeatherETLPipeline:
         Returns:
             Tuple of (weather_data, air_data)
         """
+        weather_data, air_data, extract_time = self._fetch_data(latitude, longitude)
+        self.execution_stats['extract_time'] = extract_time
+        return weather_data, air_data
+
+    def _fetch_data(self, latitude: float, longitude: float) -> Tuple[Optional[Dict], Optional[Dict], float]:
+        """
+        Fetch and validate API data without touching shared pipeline state
+        
+        Safe to call from several threads at once (run_batch prefetching).
+        
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            
+        Returns:
+            Tuple of (weather_data, air_data, extraction time in seconds)
+        """
         extract_start_time = time.time()
         
         try:
@@ -210,22 +248,21 @@ class WeatherETLPipeline:
             # Validate extracted data
             if not extractor.validate_data():
                 logger.error("Data validation failed after extraction")
-                return None, None
+                return None, None, time.time() - extract_start_time
             
             # Log extraction stats
             extract_time = time.time() - extract_start_time
-            self.execution_stats['extract_time'] = extract_time
             
             data_summary = extractor.get_data_summary()
             logger.info(f"Extraction completed in {extract_time:.2f} seconds")
             logger.info(f"Weather forecast days: {data_summary.get('forecast_days', 0)}")
             logger.info(f"Air quality data points: {data_summary.get('air_quality_hours', 0)}")
             
-            return weather_data, air_data
+            return weather_data, air_data, extract_time
             
         except Exception as e:
             logger.error(f"Data extraction failed: {e}")
-            return None, None
+            return None, None, time.time() - extract_start_time
 
     def _transform_data(self, weather_data: Dict, air_data: Dict) -> Optional[List[Dict]]:
         """
@@ -3,10 +3,60 @@ Enhanced Weather Data Transformer
 Improved version with better data validation and error handling
 """
 
+import numpy as np
 import pandas as pd
 import logging
+from bisect import bisect_left
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Iterator
+
+# Columns that vary per forecast day; every other record field is the same
+# for all days of one transformation and is stored once as a scalar
+DAILY_COLUMNS = (
+    'date', 'forecast_max_temp', 'forecast_min_temp', 'precipitation_mm',
+    'uv_index', 'weather_code', 'forecast_condition'
+)
+
+# Narrow dtypes for the DataFrame form: 0.1-unit readings fit float32, and
+# codes/indices fit int16 (nullable, since AQI readings can be missing)
+DATAFRAME_DTYPES = {
+    'current_temp_c': np.float32, 'wind_kph': np.float32,
+    'forecast_max_temp': np.float32, 'forecast_min_temp': np.float32,
+    'precipitation_mm': np.float32, 'uv_index': np.float32,
+    'pm2_5': np.float32, 'pm10': np.float32,
+    'weather_code': 'Int16', 'us_aqi': 'Int16', 'european_aqi': 'Int16'
+}
+
+# WMO weather interpretation codes used by Open-Meteo
+WEATHER_CODES = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Depositing rime fog",
+    51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+    56: "Light freezing drizzle", 57: "Dense freezing drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    66: "Light freezing rain", 67: "Heavy freezing rain",
+    71: "Slight snow fall", 73: "Moderate snow fall", 75: "Heavy snow fall",
+    77: "Snow grains", 80: "Slight rain showers", 81: "Moderate rain showers", 
+    82: "Violent rain showers", 85: "Slight snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
+# Lookup table over the whole 0..99 code range for batch description lookups
+_WEATHER_LUT = np.array([WEATHER_CODES.get(code, f"Unknown ({code})") for code in range(100)], dtype=object)
+
+# 16-point compass, one entry per 22.5 degrees starting at north
+WIND_DIRECTIONS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                   "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
+_WIND_LUT = np.array(WIND_DIRECTIONS, dtype=object)
+
+# US AQI category upper bounds (inclusive) and the category for each bin
+AQI_BREAKPOINTS = [50, 100, 150, 200, 300]
+AQI_CATEGORIES = ["Good", "Moderate", "Unhealthy for Sensitive Groups", "Unhealthy", "Very Unhealthy", "Hazardous"]
+_AQI_BINS = np.array(AQI_BREAKPOINTS)
+_AQI_LUT = np.array(AQI_CATEGORIES + ["Unknown"], dtype=object)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +78,8 @@ class WeatherTransformer:
         self.air_data = air_data
         self.transformed_data = []
         self.errors = []
+        self._columns = None
+        self._valid_mask = None
         
         logger.info("WeatherTransformer initialized")
 
@@ -38,9 +90,37 @@ class WeatherTransformer:
         Returns:
             List[Dict]: List of transformed weather records
         """
+        if not self._prepare_columns():
+            return []
+        
+        try:
+            # Expand into records only for the list form callers consume
+            self.transformed_data.extend(self.iter_records())
+            
+            logger.info("Transformation completed. %d records created", len(self.transformed_data))
+            
+            if self.errors:
+                logger.warning("Transformation completed with %d errors", len(self.errors))
+            
+            return self.transformed_data
+            
+        except Exception as e:
+            logger.error("Critical error during transformation: %s", e)
+            return []
+
+    def _prepare_columns(self) -> bool:
+        """
+        Validate the raw input and build the column form once
+        
+        Returns:
+            bool: True if columns are available
+        """
+        if self._columns is not None:
+            return True
+        
         if not self._validate_input_data():
             logger.error("Input data validation failed")
-            return []
+            return False
         
         try:
             logger.info("Starting data transformation")
@@ -51,37 +131,58 @@ class WeatherTransformer:
             daily_forecasts = self._extract_daily_forecasts()
             air_quality = self._extract_air_quality()
             
-            # Create transformed records for each forecast day
-            for i, date in enumerate(daily_forecasts.get('dates', [])):
-                try:
-                    record = self._create_weather_record(
-                        date=date,
-                        index=i,
-                        location_data=location_data,
-                        current_weather=current_weather,
-                        daily_forecasts=daily_forecasts,
-                        air_quality=air_quality
-                    )
-                    
-                    if self._validate_record(record):
-                        self.transformed_data.append(record)
-                    else:
-                        logger.warning(f"Record validation failed for date {date}")
-                        
-                except Exception as e:
-                    logger.error(f"Error transforming record for date {date}: {e}")
-                    self.errors.append(f"Date {date}: {str(e)}")
-            
-            logger.info(f"Transformation completed. {len(self.transformed_data)} records created")
-            
-            if self.errors:
-                logger.warning(f"Transformation completed with {len(self.errors)} errors")
-            
-            return self.transformed_data
+            # Build each field once as a column (per-day list or shared scalar)
+            columns = self._build_columns(
+                location_data=location_data,
+                current_weather=current_weather,
+                daily_forecasts=daily_forecasts,
+                air_quality=air_quality
+            )
+            self._valid_mask = self._validate_columns(columns)
+            self._columns = columns
+            return True
             
         except Exception as e:
-            logger.error(f"Critical error during transformation: {e}")
-            return []
+            logger.error("Critical error during transformation: %s", e)
+            return False
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the valid transformed records one at a time
+        
+        Builds from the column form, so a consumer that streams the records
+        never needs the whole list of dicts in memory; transform() is not
+        required first.
+        
+        Yields:
+            Dict: Transformed weather record for one date
+        """
+        if not self._prepare_columns():
+            return
+        
+        columns = self._columns
+        names = list(columns)
+        n_days = len(columns['date'])
+        expanded = [self._daily_values(name) if name in DAILY_COLUMNS else repeat(columns[name], n_days)
+                    for name in names]
+        
+        for values, is_valid in zip(zip(*expanded), self._valid_mask):
+            record = dict(zip(names, values))
+            if is_valid:
+                yield record
+            else:
+                logger.warning("Record validation failed for date %s", record['date'])
+
+    def _daily_values(self, name: str) -> List:
+        """Values of a daily column as plain Python objects, None where missing"""
+        column = self._columns[name]
+        if not isinstance(column, np.ndarray):
+            return column
+        
+        values = column.tolist()
+        for i in np.flatnonzero(np.isnan(column)):
+            values[i] = None
+        return values
 
     def _validate_input_data(self) -> bool:
         """
@@ -145,11 +246,11 @@ class WeatherTransformer:
         daily = self.weather_data.get('daily', {})
         return {
             'dates': daily.get('time', []),
-            'max_temps': [self._safe_float(t) for t in daily.get('temperature_2m_max', [])],
-            'min_temps': [self._safe_float(t) for t in daily.get('temperature_2m_min', [])],
-            'precipitation': [self._safe_float(p) for p in daily.get('precipitation_sum', [])],
-            'uv_index': [self._safe_float(uv) for uv in daily.get('uv_index_max', [])],
-            'weather_codes': [self._safe_int(wc) for wc in daily.get('weathercode', [])]
+            'max_temps': self._to_float_array(daily.get('temperature_2m_max', [])),
+            'min_temps': self._to_float_array(daily.get('temperature_2m_min', [])),
+            'precipitation': self._to_float_array(daily.get('precipitation_sum', [])),
+            'uv_index': self._to_float_array(daily.get('uv_index_max', [])),
+            'weather_codes': np.nan_to_num(self._to_float_array(daily.get('weathercode', []))).astype(np.int64)
         }
 
     def _extract_air_quality(self) -> Dict[str, Any]:
@@ -158,43 +259,56 @@ class WeatherTransformer:
         
         # Get the most recent air quality readings
         times = hourly.get('time', [])
-        pm2_5_values = [self._safe_float(v) for v in hourly.get('pm2_5', [])]
-        pm10_values = [self._safe_float(v) for v in hourly.get('pm10', [])]
-        us_aqi_values = [self._safe_int(v) for v in hourly.get('us_aqi', [])]
-        eu_aqi_values = [self._safe_int(v) for v in hourly.get('european_aqi', [])]
-        
-        # Use most recent non-null values
         latest_index = len(times) - 1 if times else 0
         
+        # Only the selected reading is converted, not the whole hourly series
         return {
-            'pm2_5': self._get_latest_valid_value(pm2_5_values, latest_index),
-            'pm10': self._get_latest_valid_value(pm10_values, latest_index),
-            'us_aqi': self._get_latest_valid_value(us_aqi_values, latest_index),
-            'european_aqi': self._get_latest_valid_value(eu_aqi_values, latest_index),
+            'pm2_5': self._get_latest_value(hourly.get('pm2_5', []), latest_index, self._safe_float),
+            'pm10': self._get_latest_value(hourly.get('pm10', []), latest_index, self._safe_float),
+            'us_aqi': self._get_latest_value(hourly.get('us_aqi', []), latest_index, self._safe_int),
+            'european_aqi': self._get_latest_value(hourly.get('european_aqi', []), latest_index, self._safe_int),
             'measurement_time': times[latest_index] if times else None
         }
 
-    def _create_weather_record(self, date: str, index: int, location_data: Dict, 
-                              current_weather: Dict, daily_forecasts: Dict, 
-                              air_quality: Dict) -> Dict[str, Any]:
+    def _build_columns(self, location_data: Dict, current_weather: Dict,
+                       daily_forecasts: Dict, air_quality: Dict) -> Dict[str, Any]:
         """
-        Create a standardized weather record
+        Build the standardized weather record fields as columns
         
         Args:
-            date (str): Forecast date
-            index (int): Index in the daily forecast arrays
             location_data (Dict): Location information
             current_weather (Dict): Current weather data
             daily_forecasts (Dict): Daily forecast data
             air_quality (Dict): Air quality data
             
         Returns:
-            Dict: Standardized weather record
+            Dict: Field name -> list (float64 array for the numeric forecasts)
+                  with one value per date for DAILY_COLUMNS, a single shared
+                  value for all other fields
         """
+        dates = list(daily_forecasts.get('dates', []))
+        n_days = len(dates)
+        
+        def per_day(values: np.ndarray) -> List:
+            # Truncate or pad with None so every daily column has one value per date
+            values = values[:n_days].tolist()
+            return values + [None] * (n_days - len(values))
+        
+        def per_day_array(values: np.ndarray) -> np.ndarray:
+            # Same as per_day but kept as float64 (NaN padding) so the
+            # DataFrame takes the array as is
+            padded = np.full(n_days, np.nan)
+            count = min(n_days, len(values))
+            padded[:count] = values[:count]
+            return padded
+        
+        weather_codes = per_day(daily_forecasts['weather_codes'])
+        timestamp = datetime.utcnow().isoformat()
+        
         return {
             # Temporal data
-            'date': date,
-            'last_updated': datetime.utcnow().isoformat(),
+            'date': dates,
+            'last_updated': timestamp,
             'measurement_time': air_quality.get('measurement_time'),
             
             # Location data
@@ -210,14 +324,12 @@ class WeatherTransformer:
             'wind_dir': self.get_wind_direction(current_weather['winddirection']),
             
             # Daily forecast data
-            'forecast_max_temp': self._safe_get_list_item(daily_forecasts['max_temps'], index),
-            'forecast_min_temp': self._safe_get_list_item(daily_forecasts['min_temps'], index),
-            'precipitation_mm': self._safe_get_list_item(daily_forecasts['precipitation'], index),
-            'uv_index': self._safe_get_list_item(daily_forecasts['uv_index'], index),
-            'weather_code': self._safe_get_list_item(daily_forecasts['weather_codes'], index),
-            'forecast_condition': self.get_weather_description(
-                self._safe_get_list_item(daily_forecasts['weather_codes'], index)
-            ),
+            'forecast_max_temp': per_day_array(daily_forecasts['max_temps']),
+            'forecast_min_temp': per_day_array(daily_forecasts['min_temps']),
+            'precipitation_mm': per_day_array(daily_forecasts['precipitation']),
+            'uv_index': per_day_array(daily_forecasts['uv_index']),
+            'weather_code': weather_codes,
+            'forecast_condition': self.get_weather_descriptions(weather_codes),
             
             # Air quality data
             'pm2_5': air_quality['pm2_5'],
@@ -228,40 +340,48 @@ class WeatherTransformer:
             
             # Metadata
             'data_source': 'open-meteo',
-            'created_at': datetime.utcnow().isoformat()
+            'created_at': timestamp
         }
 
-    def _validate_record(self, record: Dict[str, Any]) -> bool:
+    def _validate_columns(self, columns: Dict[str, Any]) -> np.ndarray:
         """
-        Validate a transformed record
+        Validate all transformed records at once
         
         Args:
-            record (Dict): Weather record to validate
+            columns (Dict): Columns from _build_columns
             
         Returns:
-            bool: True if record is valid
+            np.ndarray: Boolean mask, True where the record for that date is valid
         """
+        dates = columns['date']
+        valid = np.fromiter((date is not None for date in dates), dtype=bool, count=len(dates))
+        
         # Check required fields
-        required_fields = ['date', 'latitude', 'longitude']
-        for field in required_fields:
-            if field not in record or record[field] is None:
-                logger.warning(f"Missing required field: {field}")
-                return False
+        for field in ('latitude', 'longitude'):
+            if columns[field] is None:
+                logger.warning("Missing required field: %s", field)
+                return np.zeros(len(dates), dtype=bool)
         
         # Validate coordinate ranges
-        lat, lon = record['latitude'], record['longitude']
+        lat, lon = columns['latitude'], columns['longitude']
         if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-            logger.warning(f"Invalid coordinates: {lat}, {lon}")
-            return False
+            logger.warning("Invalid coordinates: %s, %s", lat, lon)
+            return np.zeros(len(dates), dtype=bool)
         
-        # Validate temperature ranges (basic sanity check)
-        for temp_field in ['current_temp_c', 'forecast_max_temp', 'forecast_min_temp']:
-            temp = record.get(temp_field)
-            if temp is not None and not (-100 <= temp <= 70):
-                logger.warning(f"Temperature out of range: {temp_field}={temp}")
-                return False
+        # Validate temperature ranges (basic sanity check); missing values pass
+        current_temp = columns['current_temp_c']
+        if current_temp is not None and not (-100 <= current_temp <= 70):
+            logger.warning("Temperature out of range: current_temp_c=%s", current_temp)
+            return np.zeros(len(dates), dtype=bool)
         
-        return True
+        for temp_field in ('forecast_max_temp', 'forecast_min_temp'):
+            temps = np.asarray(columns[temp_field], dtype=np.float64)
+            out_of_range = (temps < -100) | (temps > 70)
+            if out_of_range.any():
+                logger.warning("Temperature out of range: %s=%s", temp_field, temps[out_of_range].tolist())
+                valid &= ~out_of_range
+        
+        return valid
 
     def _safe_float(self, value: Any, default: float = 0.0) -> float:
         """Safely convert value to float"""
@@ -281,6 +401,33 @@ class WeatherTransformer:
         except (TypeError, ValueError):
             return default
 
+    @staticmethod
+    def _to_float_array(values: List, default: float = 0.0) -> np.ndarray:
+        """
+        Convert a whole API value list to float64 in one pass
+        
+        Missing, "N/A" and unparseable entries become default, as with
+        _safe_float; apply astype(np.int64) afterwards for _safe_int semantics
+        (truncation toward zero).
+        
+        Args:
+            values (List): Raw values from the API
+            default (float): Value for entries that cannot be converted
+            
+        Returns:
+            np.ndarray: float64 array with one entry per input value
+        """
+        if not values:
+            return np.empty(0, dtype=np.float64)
+        
+        converted = np.array(pd.to_numeric(pd.Series(values, dtype=object), errors='coerce'), dtype=np.float64)
+        
+        # Only entries that failed to parse get the default; NaN sent as a number stays NaN
+        for i in np.flatnonzero(np.isnan(converted)):
+            if not isinstance(values[i], float):
+                converted[i] = default
+        return converted
+
     def _safe_get_list_item(self, lst: List, index: int, default: Any = None) -> Any:
         """Safely get item from list by index"""
         try:
@@ -288,14 +435,15 @@ class WeatherTransformer:
         except (TypeError, IndexError):
             return default
 
-    def _get_latest_valid_value(self, values: List, start_index: int) -> Any:
-        """Get the latest valid (non-None) value from a list"""
-        for i in range(start_index, -1, -1):
-            if i < len(values) and values[i] is not None:
-                return values[i]
-        return None
+    def _get_latest_value(self, values: List, start_index: int, convert) -> Any:
+        """Convert the value at start_index (or the last one if the list is shorter)"""
+        # _safe_float/_safe_int never return None, so this is the latest valid value
+        if not values:
+            return None
+        return convert(values[min(start_index, len(values) - 1)])
 
     @staticmethod
+    @lru_cache(maxsize=256, typed=True)
     def get_weather_description(code: int) -> str:
         """
         Convert weather code to human-readable description
@@ -306,19 +454,27 @@ class WeatherTransformer:
         Returns:
             str: Weather description
         """
-        weather_codes = {
-            0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-            45: "Fog", 48: "Depositing rime fog",
-            51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-            56: "Light freezing drizzle", 57: "Dense freezing drizzle",
-            61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-            66: "Light freezing rain", 67: "Heavy freezing rain",
-            71: "Slight snow fall", 73: "Moderate snow fall", 75: "Heavy snow fall",
-            77: "Snow grains", 80: "Slight rain showers", 81: "Moderate rain showers", 
-            82: "Violent rain showers", 85: "Slight snow showers", 86: "Heavy snow showers",
-            95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-        }
-        return weather_codes.get(code, f"Unknown ({code})")
+        return WEATHER_CODES.get(code, f"Unknown ({code})")
+
+    @staticmethod
+    def get_weather_descriptions(codes: List[Optional[int]]) -> List[str]:
+        """
+        Convert a sequence of weather codes to descriptions in one lookup
+        
+        Args:
+            codes (List[int]): Weather codes from API (None for missing days)
+            
+        Returns:
+            List[str]: Weather descriptions, same as get_weather_description per code
+        """
+        code_array = np.fromiter((-1 if code is None else code for code in codes), dtype=np.int64, count=len(codes))
+        in_range = (code_array >= 0) & (code_array < len(_WEATHER_LUT))
+        
+        descriptions = _WEATHER_LUT[np.where(in_range, code_array, 0)]
+        for i in np.flatnonzero(~in_range):
+            descriptions[i] = f"Unknown ({codes[i]})"
+        
+        return descriptions.tolist()
 
     @staticmethod
     def get_wind_direction(degrees: float) -> str:
@@ -335,14 +491,35 @@ class WeatherTransformer:
             return "Unknown"
         
         try:
-            directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                         "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-            index = round(degrees / 22.5) % 16
-            return directions[index]
+            return WIND_DIRECTIONS[round(degrees / 22.5) % 16]
         except (TypeError, ValueError):
             return "Unknown"
 
     @staticmethod
+    def get_wind_directions(degrees_values) -> List[str]:
+        """
+        Convert a sequence of wind directions in degrees to compass directions
+        
+        Args:
+            degrees_values: Wind directions in degrees (None/"N/A"/NaN for missing)
+            
+        Returns:
+            List[str]: Compass directions, same as get_wind_direction per value
+        """
+        degrees = np.fromiter(
+            (value if isinstance(value, (int, float, np.number)) else np.nan for value in degrees_values),
+            dtype=np.float64, count=len(degrees_values)
+        )
+        known = np.isfinite(degrees)
+        
+        # np.rint rounds half to even like round(); % 16 wraps negatives as in Python
+        idx = np.rint(np.where(known, degrees, 0) / 22.5).astype(np.int64) % 16
+        directions = _WIND_LUT[idx]
+        directions[~known] = "Unknown"
+        return directions.tolist()
+
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
     def get_aqi_category(aqi: int) -> str:
         """
         Convert AQI value to category description
@@ -357,34 +534,70 @@ class WeatherTransformer:
             return "Unknown"
         
         try:
-            aqi = int(aqi)
-            if aqi <= 50:
-                return "Good"
-            elif aqi <= 100:
-                return "Moderate"
-            elif aqi <= 150:
-                return "Unhealthy for Sensitive Groups"
-            elif aqi <= 200:
-                return "Unhealthy"
-            elif aqi <= 300:
-                return "Very Unhealthy"
-            else:
-                return "Hazardous"
+            return AQI_CATEGORIES[bisect_left(AQI_BREAKPOINTS, int(aqi))]
         except (ValueError, TypeError):
             return "Unknown"
 
+    @staticmethod
+    def get_aqi_categories(aqi_values) -> List[str]:
+        """
+        Convert a sequence of AQI values to categories in one pass
+        
+        Args:
+            aqi_values: AQI values (None/NaN for missing readings)
+            
+        Returns:
+            List[str]: AQI categories, "Unknown" where the value is missing
+        """
+        aqi_array = pd.to_numeric(pd.Series(aqi_values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+        missing = np.isnan(aqi_array)
+        
+        # Truncate like int() in get_aqi_category, then binary-search the bins
+        idx = np.searchsorted(_AQI_BINS, np.trunc(np.where(missing, 0, aqi_array)), side='left')
+        idx[missing] = len(_AQI_LUT) - 1
+        return _AQI_LUT[idx].tolist()
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert transformed data to pandas DataFrame
         
+        Numeric forecast columns are downcast (see DATAFRAME_DTYPES) and
+        'date' is parsed to datetime64.
+        
         Returns:
             pd.DataFrame: DataFrame with transformed data
         """
-        if not self.transformed_data:
+        if not self._prepare_columns() or not self._valid_mask.any():
             logger.warning("No transformed data available for DataFrame conversion")
             return pd.DataFrame()
         
-        return pd.DataFrame(self.transformed_data)
+        # Build straight from the columns; pandas broadcasts the scalar fields
+        df = pd.DataFrame(self._columns)
+        df = df[self._valid_mask].reset_index(drop=True)
+        
+        df = df.astype(DATAFRAME_DTYPES)
+        df['date'] = pd.to_datetime(df['date'], cache=True)
+        return df
+
+    def to_compact(self) -> Dict[str, Any]:
+        """
+        Transformed data without per-day repetition of the shared fields
+        
+        Location, current weather, air quality and timestamps are stored once
+        under 'metadata'; 'daily' holds only the DAILY_COLUMNS for each valid
+        date. A flat record is {**metadata, **day}.
+        
+        Returns:
+            Dict: {'metadata': Dict, 'daily': List[Dict]}
+        """
+        if not self._prepare_columns():
+            return {"metadata": {}, "daily": []}
+        
+        metadata = {name: value for name, value in self._columns.items() if name not in DAILY_COLUMNS}
+        rows = zip(*(self._daily_values(name) for name in DAILY_COLUMNS))
+        daily = [dict(zip(DAILY_COLUMNS, row)) for row, is_valid in zip(rows, self._valid_mask) if is_valid]
+        
+        return {"metadata": metadata, "daily": daily}
 
     def get_transformation_summary(self) -> Dict[str, Any]:
         """
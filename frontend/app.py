@@ -10,6 +10,7 @@ import sys
 import logging
 import requests
 from datetime import datetime, timedelta, UTC
+from types import MappingProxyType
 from flask import Flask, render_template, request, jsonify, session, flash, redirect, url_for
 
 if sys.platform == "win32":
@@ -39,6 +40,8 @@ class CustomJSONProvider(DefaultJSONProvider):
     def default(self, obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
+        if isinstance(obj, MappingProxyType):
+            return dict(obj)
         try:
             import numpy as np
             if isinstance(obj, np.bool_):
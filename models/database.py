@@ -4,7 +4,9 @@ SQLAlchemy models for weather data management
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Text, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
@@ -16,6 +18,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 string (trailing 'Z' allowed); a batch shares few distinct timestamps"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 # SQLAlchemy base
 Base = declarative_base()
 
@@ -160,13 +168,13 @@ class WeatherRecord(Base):
         # Convert datetime strings to datetime objects
         if 'last_updated' in data and isinstance(data['last_updated'], str):
             try:
-                data['last_updated'] = datetime.fromisoformat(data['last_updated'].replace('Z', '+00:00'))
+                data['last_updated'] = _parse_iso_datetime(data['last_updated'])
             except:
                 data['last_updated'] = datetime.utcnow()
         
         if 'measurement_time' in data and isinstance(data['measurement_time'], str):
             try:
-                data['measurement_time'] = datetime.fromisoformat(data['measurement_time'].replace('Z', '+00:00'))
+                data['measurement_time'] = _parse_iso_datetime(data['measurement_time'])
             except:
                 data['measurement_time'] = None
         
@@ -230,6 +238,50 @@ class WeatherRecord(Base):
             logger.error(f"Error getting historical records: {e}")
             return []
     
+    @classmethod
+    def get_historical_arrays(cls, latitude: float, longitude: float,
+                              days: int = 30, tolerance: float = 0.01) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get historical dates and current temperatures as NumPy arrays
+        
+        Fetches only the two needed columns instead of materializing ORM objects.
+        
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            days: Number of days of history to retrieve
+            tolerance: Coordinate tolerance for matching
+            
+        Returns:
+            Tuple of (dates as datetime64[ns], temperatures as float64 with NaN for missing)
+        """
+        empty = (np.array([], dtype='datetime64[ns]'), np.array([], dtype=np.float64))
+        
+        if not db_session:
+            logger.error("Database session not initialized")
+            return empty
+        
+        try:
+            cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d')
+            
+            rows = db_session.query(cls.date, cls.current_temp_c).filter(
+                cls.latitude.between(latitude - tolerance, latitude + tolerance),
+                cls.longitude.between(longitude - tolerance, longitude + tolerance),
+                cls.date >= cutoff_date
+            ).order_by(cls.date.asc()).all()
+            
+            if not rows:
+                return empty
+            
+            dates, temps = zip(*rows)
+            return (
+                np.array(dates, dtype='datetime64[ns]'),
+                np.array(temps, dtype=np.float64)
+            )
+        except Exception as e:
+            logger.error(f"Error getting historical arrays: {e}")
+            return empty
+    
     @classmethod
     def get_history_for_location(cls, latitude: float, longitude: float, 
                                days: int = 30, tolerance: float = 0.01) -> List['WeatherRecord']:
@@ -278,7 +330,7 @@ class WeatherRecord(Base):
             return pd.Series(dtype=float)
         
         df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
+        df['date'] = pd.to_datetime(df['date'], cache=True)
         df.set_index('date', inplace=True)
         
         return df['temperature']
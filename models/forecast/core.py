@@ -6,7 +6,8 @@ Main WeatherForecaster class for time series forecasting
 import numpy as np
 import pandas as pd
 import logging
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 import warnings
 
@@ -14,6 +15,7 @@ import warnings
 try:
     from statsmodels.tsa.arima.model import ARIMA
     from statsmodels.tsa.stattools import adfuller
+    from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
     STATSMODELS_AVAILABLE = True
 except ImportError:
     STATSMODELS_AVAILABLE = False
@@ -24,6 +26,71 @@ warnings.filterwarnings("ignore", category=UserWarning, module="statsmodels")
 
 logger = logging.getLogger(__name__)
 
+# Above this length the generic statsmodels adfuller is used; below it the
+# regression setup dominates and the direct least-squares version is cheaper
+ADF_DIRECT_MAX_LENGTH = 200
+
+
+def _adf_ols(values: np.ndarray) -> tuple:
+    """
+    Augmented Dickey-Fuller test with constant and AIC lag selection,
+    solved directly with NumPy least squares
+    
+    Mirrors statsmodels' adfuller(values, autolag='AIC'): lags 0..maxlag
+    are compared by AIC on a common sample, the chosen lag is refit on all
+    usable observations, and p-value/critical values come from MacKinnon.
+    
+    Args:
+        values: Time series values to test
+        
+    Returns:
+        Tuple of (adf statistic, p-value, used lag, nobs, critical values, best AIC)
+    """
+    n = len(values)
+    maxlag = min(n // 2 - 2, int(np.ceil(12.0 * np.power(n / 100.0, 0.25))))
+    if maxlag < 0:
+        raise ValueError("sample size is too short to use selected regression component")
+    
+    diffs = np.diff(values)
+    
+    def design(lags: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Columns: y_{t-1}, dy_{t-1..t-lags}, constant; target dy_t
+        nobs = len(diffs) - lags
+        X = np.empty((nobs, lags + 2))
+        X[:, 0] = values[-nobs - 1:-1]
+        for j in range(1, lags + 1):
+            X[:, j] = diffs[lags - j:lags - j + nobs]
+        X[:, -1] = 1.0
+        return X, diffs[-nobs:]
+    
+    # AIC for every lag on the sample usable at maxlag
+    X_full, y_full = design(maxlag)
+    nobs = len(y_full)
+    best = None
+    for lags in range(maxlag + 1):
+        X = np.concatenate((X_full[:, :lags + 1], X_full[:, -1:]), axis=1)
+        beta, _, rank, _ = np.linalg.lstsq(X, y_full, rcond=None)
+        resid = y_full - X @ beta
+        ssr = np.dot(resid, resid)
+        aic = nobs * (np.log(2 * np.pi) + np.log(ssr / nobs) + 1) + 2 * rank
+        if best is None or aic < best[0]:
+            best = (aic, lags)
+    icbest, usedlag = best
+    
+    # Refit the chosen lag on every observation it can use
+    X, y = design(usedlag)
+    nobs = len(y)
+    beta, _, _, _ = np.linalg.lstsq(X, y, rcond=None)
+    resid = y - X @ beta
+    sigma2 = np.dot(resid, resid) / (nobs - X.shape[1])
+    adfstat = beta[0] / np.sqrt(sigma2 * np.linalg.pinv(X.T @ X)[0, 0])
+    
+    pvalue = mackinnonp(adfstat, regression='c', N=1)
+    crit = mackinnoncrit(N=1, regression='c', nobs=nobs)
+    critvalues = {"1%": crit[0], "5%": crit[1], "10%": crit[2]}
+    
+    return adfstat, pvalue, usedlag, nobs, critvalues, icbest
+
 
 class WeatherForecaster:
     """
@@ -45,7 +112,10 @@ class WeatherForecaster:
         self.model = None
         self.fitted_model = None
         self.data_series = None
+        self._values = None
+        self._historical_stats = None
         self.forecast_results = None
+        self._adf_cache: Dict[bytes, tuple] = {}
         
         logger.info(f"WeatherForecaster initialized with ARIMA order {default_order}")
     
@@ -67,6 +137,7 @@ class WeatherForecaster:
             
             # Remove missing values
             self.data_series = data.dropna()
+            self._adf_cache.clear()
             
             if len(self.data_series) < min_periods:
                 logger.error(f"Insufficient data after removing NaN: {len(self.data_series)} points")
@@ -77,16 +148,20 @@ class WeatherForecaster:
                 logger.error("Data must have datetime index")
                 return False
             
-            # Sort by date
+            # Sort by date (index[0] / index[-1] are the date range from here on)
             self.data_series = self.data_series.sort_index()
+            self._values = self.data_series.to_numpy(dtype=np.float64, copy=False)
+            self._historical_stats = None
             
             # Check for reasonable temperature values
-            if self.data_series.min() < -100 or self.data_series.max() > 70:
+            data_min = self._values.min()
+            data_max = self._values.max()
+            if data_min < -100 or data_max > 70:
                 logger.warning("Temperature values outside reasonable range detected")
             
             logger.info(f"Data prepared successfully: {len(self.data_series)} data points")
-            logger.info(f"Date range: {self.data_series.index.min()} to {self.data_series.index.max()}")
-            logger.info(f"Temperature range: {self.data_series.min():.1f}°C to {self.data_series.max():.1f}°C")
+            logger.info(f"Date range: {self.data_series.index[0]} to {self.data_series.index[-1]}")
+            logger.info(f"Temperature range: {data_min:.1f}°C to {data_max:.1f}°C")
             
             return True
             
@@ -109,7 +184,7 @@ class WeatherForecaster:
         
         try:
             # Perform Augmented Dickey-Fuller test
-            adf_result = adfuller(self.data_series)
+            adf_result = self._adfuller(self._values)
             
             is_stationary = adf_result[1] <= significance_level
             
@@ -130,14 +205,69 @@ class WeatherForecaster:
             logger.error(f"Error checking stationarity: {e}")
             return {"error": str(e)}
     
-    def auto_select_order(self, max_p: int = 5, max_d: int = 2, max_q: int = 5) -> Tuple[int, int, int]:
+    def _adfuller(self, values: np.ndarray) -> tuple:
+        """
+        Run the Augmented Dickey-Fuller test, memoized on the series values
+        
+        Args:
+            values: Time series values to test
+            
+        Returns:
+            Raw adfuller result tuple
+        """
+        key = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        result = self._adf_cache.get(key)
+        if result is None:
+            if len(values) <= ADF_DIRECT_MAX_LENGTH:
+                try:
+                    result = _adf_ols(values)
+                except (ValueError, np.linalg.LinAlgError):
+                    result = adfuller(values, autolag='AIC')
+            else:
+                result = adfuller(values, autolag='AIC')
+            self._adf_cache[key] = result
+        return result
+    
+    def _ndiffs(self, max_d: int, alpha: float = 0.05) -> int:
+        """
+        Estimate the differencing order with repeated ADF tests
+        
+        Args:
+            max_d: Maximum differencing order to consider
+            alpha: Significance level for the unit-root test
+            
+        Returns:
+            int: Smallest d for which the differenced series is stationary
+        """
+        values = self._values
+        for d in range(max_d + 1):
+            try:
+                p_value = self._adfuller(values)[1]
+            except Exception:
+                return d
+            
+            if p_value <= alpha:
+                return d
+            values = np.diff(values)
+        
+        return max_d
+    
+    def auto_select_order(self, max_p: int = 5, max_d: int = 2, max_q: int = 5,
+                          patience: int = 8, min_improvement: float = 0.5) -> Tuple[int, int, int]:
         """
         Automatically select optimal ARIMA order using AIC criterion
         
+        Candidates are tried from simplest to most complex (by p + q) and the
+        search stops once `patience` consecutive fits fail to improve the best
+        AIC by more than `min_improvement`. The (p, q) grid is shrunk so that
+        the series has at least 3 * (p + d + q) points for every candidate.
+        
         Args:
-            max_p: Maximum AR order to test
-            max_d: Maximum differencing order to test
-            max_q: Maximum MA order to test
+            max_p: Maximum AR order to test (reduced for short series)
+            max_d: Maximum differencing order (d is fixed up front via ADF)
+            max_q: Maximum MA order to test (reduced for short series)
+            patience: Consecutive non-improving candidates before stopping
+            min_improvement: AIC decrease required to count as an improvement
             
         Returns:
             Tuple of optimal (p, d, q) order
@@ -152,25 +282,50 @@ class WeatherForecaster:
             best_aic = float('inf')
             best_order = self.default_order
             
+            # Fix the differencing order with unit-root tests, then search (p, q)
+            d = self._ndiffs(max_d)
+            logger.info(f"Differencing order selected by ADF: d={d}")
+            
+            # Rule-of-thumb minimum for stable MLE: 3 * (p + d + q) points for
+            # the largest candidate; trim the larger of max_p/max_q until it fits
+            pq_budget = len(self.data_series) // 3 - d
+            if pq_budget < 1:
+                logger.info(f"Series too short for grid search ({len(self.data_series)} points), using default order")
+                return self.default_order
+            while max_p + max_q > pq_budget:
+                if max_p >= max_q:
+                    max_p -= 1
+                else:
+                    max_q -= 1
+            
+            candidates = sorted(
+                ((p, q) for p in range(max_p + 1) for q in range(max_q + 1)),
+                key=lambda pq: pq[0] + pq[1]
+            )
+            
             # Test different combinations
-            for p in range(max_p + 1):
-                for d in range(max_d + 1):
-                    for q in range(max_q + 1):
-                        try:
-                            # Skip if no parameters
-                            if p == 0 and d == 0 and q == 0:
-                                continue
-                            
-                            model = ARIMA(self.data_series, order=(p, d, q))
-                            fitted_model = model.fit()
-                            aic = fitted_model.aic
-                            
-                            if aic < best_aic:
-                                best_aic = aic
-                                best_order = (p, d, q)
-                                
-                        except Exception:
-                            continue
+            no_improve = 0
+            for p, q in candidates:
+                # Skip if no parameters
+                if p == 0 and d == 0 and q == 0:
+                    continue
+                
+                try:
+                    model = ARIMA(self.data_series, order=(p, d, q))
+                    fitted_model = model.fit()
+                    aic = fitted_model.aic
+                except Exception:
+                    aic = float('inf')
+                
+                if aic < best_aic - min_improvement:
+                    best_aic = aic
+                    best_order = (p, d, q)
+                    no_improve = 0
+                else:
+                    no_improve += 1
+                    if no_improve >= patience:
+                        logger.info(f"AIC stalled after {patience} candidates, stopping search")
+                        break
             
             logger.info(f"Optimal ARIMA order selected: {best_order} (AIC: {best_aic:.2f})")
             return best_order
@@ -185,7 +340,8 @@ class WeatherForecaster:
         
         Args:
             order: ARIMA order (p, d, q). If None, uses default or auto-selected
-            auto_select: Whether to automatically select optimal order
+            auto_select: Whether to automatically select optimal order (needs at
+                least 20 points; the search grid shrinks to fit shorter series)
             
         Returns:
             bool: True if model fitted successfully
@@ -221,6 +377,28 @@ class WeatherForecaster:
             logger.error(f"Error fitting model: {e}")
             return False
     
+    def slim_model(self):
+        """
+        Drop smoother and scratch arrays from the fitted results to reduce memory
+        
+        Forecasting only needs the parameters and the final filtered state, so the
+        model remains usable for generate_forecast afterwards. Residual diagnostics
+        should be run before calling this.
+        """
+        if self.fitted_model is None:
+            return
+        
+        results = self.fitted_model._results
+        heavy_prefixes = ('smoothed_', 'scaled_smoothed_', 'smoothing_error',
+                          'innovations_transition', '_kalman_gain', 'tmp')
+        
+        for obj in (results, getattr(results, 'filter_results', None)):
+            if obj is None:
+                continue
+            for name, value in list(vars(obj).items()):
+                if name.startswith(heavy_prefixes) and isinstance(value, np.ndarray):
+                    setattr(obj, name, None)
+    
     def generate_forecast(self, steps: int = 3, confidence_level: float = 0.95) -> Dict[str, Any]:
         """
         Generate weather forecast using the fitted ARIMA model
@@ -243,28 +421,36 @@ class WeatherForecaster:
             forecast = self.fitted_model.forecast(steps=steps)
             conf_int = self.fitted_model.get_forecast(steps=steps).conf_int(alpha=1-confidence_level)
             
+            # Round once in NumPy and index plain lists inside the loop
+            rounded_forecast = np.round(np.asarray(forecast, dtype=np.float64), 1).tolist()
+            rounded_conf_int = np.round(np.asarray(conf_int, dtype=np.float64), 1).tolist()
+            
             # Create future dates
             last_date = self.data_series.index[-1]
-            future_dates = [last_date + timedelta(days=i+1) for i in range(steps)]
+            future_dates = pd.date_range(
+                start=last_date + pd.Timedelta(days=1), periods=steps, freq='D'
+            ).strftime('%Y-%m-%d').tolist()
             
             # Prepare forecast results
             forecast_data = []
             for i in range(steps):
                 forecast_data.append({
-                    "date": future_dates[i].strftime('%Y-%m-%d'),
-                    "forecast_temp": round(float(forecast.iloc[i]), 1),
-                    "lower_bound": round(float(conf_int.iloc[i, 0]), 1),
-                    "upper_bound": round(float(conf_int.iloc[i, 1]), 1),
+                    "date": future_dates[i],
+                    "forecast_temp": rounded_forecast[i],
+                    "lower_bound": rounded_conf_int[i][0],
+                    "upper_bound": rounded_conf_int[i][1],
                     "confidence_level": confidence_level
                 })
             
             # Calculate forecast statistics
-            forecast_mean = float(forecast.mean())
-            forecast_std = float(forecast.std())
+            forecast_values = forecast.to_numpy(dtype=np.float64)
+            forecast_mean = float(forecast_values.mean())
+            forecast_std = float(forecast_values.std(ddof=1))
             
-            # Historical comparison
-            historical_mean = float(self.data_series.mean())
-            historical_std = float(self.data_series.std())
+            # Historical comparison (unchanged until new data is prepared)
+            if self._historical_stats is None:
+                self._historical_stats = (float(self._values.mean()), float(self._values.std(ddof=1)))
+            historical_mean, historical_std = self._historical_stats
             
             self.forecast_results = {
                 "forecast_data": forecast_data,
@@ -285,8 +471,8 @@ class WeatherForecaster:
                     "forecast_generated_at": datetime.utcnow().isoformat(),
                     "data_points_used": len(self.data_series),
                     "data_date_range": {
-                        "start": self.data_series.index.min().strftime('%Y-%m-%d'),
-                        "end": self.data_series.index.max().strftime('%Y-%m-%d')
+                        "start": self.data_series.index[0].strftime('%Y-%m-%d'),
+                        "end": self.data_series.index[-1].strftime('%Y-%m-%d')
                     }
                 }
             }
@@ -334,8 +520,8 @@ class WeatherForecaster:
                 "data_info": {
                     "observations": len(self.data_series),
                     "date_range": {
-                        "start": self.data_series.index.min().strftime('%Y-%m-%d'),
-                        "end": self.data_series.index.max().strftime('%Y-%m-%d')
+                        "start": self.data_series.index[0].strftime('%Y-%m-%d'),
+                        "end": self.data_series.index[-1].strftime('%Y-%m-%d')
                     }
                 }
             }
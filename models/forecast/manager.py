@@ -3,11 +3,23 @@ Forecast Manager
 High-level interface for weather forecasting operations
 """
 
+import os
+import copy
+import json
+import time
+import pickle
+import hashlib
+import numpy as np
 import pandas as pd
 import logging
-from typing import List, Dict, Any, Tuple
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional
 
-from .core import WeatherForecaster
+from .core import WeatherForecaster, STATSMODELS_AVAILABLE
 from .validation import validate_arima_model, validate_forecast_assumptions
 from .metrics import generate_forecast_report
 
@@ -20,15 +32,31 @@ class ForecastManager:
     Integrates with database models and provides easy-to-use interface
     """
     
-    def __init__(self, min_data_points: int = 10):
+    # Seconds a previously selected ARIMA order stays reusable for a location
+    ORDER_CACHE_TTL = 24 * 60 * 60
+    
+    # Seconds a finished forecast is served again for identical inputs
+    RESULT_CACHE_TTL = 60 * 60
+    
+    def __init__(self, min_data_points: int = 10, max_cache_size: int = 128,
+                 cache_dir: Optional[str] = None):
         """
         Initialize forecast manager
         
         Args:
             min_data_points: Minimum data points required for forecasting
+            max_cache_size: Maximum number of fitted forecasters kept in memory
+            cache_dir: Optional directory to persist fitted forecasters across restarts
         """
         self.min_data_points = min_data_points
-        self.forecasters = {}  # Cache forecasters by location
+        self.max_cache_size = max_cache_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.forecasters: OrderedDict[str, WeatherForecaster] = OrderedDict()  # LRU cache of forecasters by location
+        self._cache_lock = threading.Lock()
+        self._order_cache: Dict[str, Tuple[Tuple[int, int, int], int, float]] = {}  # location -> (order, n_points, timestamp)
+        self._result_cache: OrderedDict[Tuple, Tuple[float, Dict[str, Any]]] = OrderedDict()  # LRU of (timestamp, forecast)
         
         logger.info("ForecastManager initialized")
     
@@ -59,6 +87,30 @@ class ForecastManager:
                 latitude, longitude, historical_days, temp_type
             )
             
+            return self._forecast_from_series(temp_series, latitude, longitude, days, temp_type)
+            
+        except Exception as e:
+            logger.error(f"Error creating temperature forecast: {e}")
+            return {"error": str(e)}
+    
+    def _forecast_from_series(self, temp_series: pd.Series, latitude: float, longitude: float,
+                              days: int = 3, temp_type: str = 'avg') -> Dict[str, Any]:
+        """
+        Fit a model and forecast from an already loaded temperature series
+        
+        Does not touch the database session, so it is safe to run from worker threads.
+        
+        Args:
+            temp_series: Temperature series with datetime index
+            latitude: Location latitude
+            longitude: Location longitude
+            days: Number of days to forecast
+            temp_type: Type of temperature ('avg', 'max', 'min')
+            
+        Returns:
+            Dict with forecast results
+        """
+        try:
             if temp_series.empty:
                 return {
                     "error": "No historical temperature data available",
@@ -89,11 +141,39 @@ class ForecastManager:
             if not forecaster.prepare_data(temp_series, self.min_data_points):
                 return {"error": "Failed to prepare data for forecasting"}
             
+            # Identical inputs within the TTL give an identical forecast
+            data_hash = self._data_hash(forecaster.data_series)
+            result_key = (round(latitude, 3), round(longitude, 3), days, temp_type, data_hash)
+            cached_result = self._get_cached_result(result_key)
+            if cached_result is not None:
+                logger.info(f"Reusing cached forecast for {latitude}, {longitude}")
+                return cached_result
+            
             # Check stationarity
             stationarity = forecaster.check_stationarity()
             
-            # Fit model
-            if not forecaster.fit_model(auto_select=True):
+            # Fit model, reusing a persisted model for identical data or a
+            # recently selected order for this location if available
+            location_key = f"{latitude:.2f},{longitude:.2f}"
+            persisted = self._load_persisted_forecaster(location_key, data_hash)
+            cached_order = self._get_cached_order(location_key, len(forecaster.data_series))
+            
+            if persisted is not None and persisted.fitted_model is not None:
+                logger.info(f"Reusing persisted ARIMA model for {location_key}")
+                forecaster.model = persisted.model
+                forecaster.fitted_model = persisted.fitted_model
+                fitted = True
+            elif cached_order is not None:
+                logger.info(f"Reusing cached ARIMA order {cached_order} for {location_key}")
+                fitted = forecaster.fit_model(order=cached_order, auto_select=False)
+            else:
+                fitted = forecaster.fit_model(auto_select=True)
+                if fitted:
+                    entry = (forecaster.fitted_model.model.order, len(forecaster.data_series), time.time())
+                    with self._cache_lock:
+                        self._order_cache[location_key] = entry
+            
+            if not fitted:
                 return {"error": "Failed to fit forecasting model"}
             
             # Validate model
@@ -115,9 +195,12 @@ class ForecastManager:
             forecast_result["model_validation"] = validation
             forecast_result["data_assumptions"] = assumptions
             
-            # Cache forecaster for potential reuse
-            location_key = f"{latitude:.2f},{longitude:.2f}"
-            self.forecasters[location_key] = forecaster
+            # Cache forecaster for potential reuse (diagnostics are done, drop smoother state)
+            forecaster.slim_model()
+            self._cache_forecaster(location_key, forecaster)
+            if persisted is None:
+                self._persist_forecaster(location_key, forecaster, data_hash)
+            self._cache_result(result_key, forecast_result)
             
             logger.info(f"Forecast created successfully for {latitude}, {longitude}")
             
@@ -127,18 +210,60 @@ class ForecastManager:
             logger.error(f"Error creating temperature forecast: {e}")
             return {"error": str(e)}
     
+    def _get_cached_order(self, location_key: str, n_points: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Get a previously selected ARIMA order if it is still applicable
+        
+        Args:
+            location_key: Location cache key
+            n_points: Number of data points in the current series
+            
+        Returns:
+            Cached (p, d, q) order or None
+        """
+        with self._cache_lock:
+            entry = self._order_cache.get(location_key)
+        if entry is None:
+            # Fall back to the order recorded on disk by a previous process
+            metadata = self._read_cache_metadata(location_key)
+            if metadata is None:
+                return None
+            entry = (tuple(metadata["order"]), metadata["n_points"], metadata["ts_last"])
+            with self._cache_lock:
+                # Keep an order another worker stored while the file was read
+                entry = self._order_cache.setdefault(location_key, entry)
+        
+        order, cached_points, timestamp = entry
+        if time.time() - timestamp > self.ORDER_CACHE_TTL:
+            with self._cache_lock:
+                # Only drop the expired entry, not one stored since it was read
+                if self._order_cache.get(location_key) is entry:
+                    del self._order_cache[location_key]
+            return None
+        
+        if abs(n_points - cached_points) >= 5:
+            return None
+        
+        return order
+    
     def create_multi_location_forecast(self, locations: List[Tuple[float, float]], 
-                                     days: int = 3) -> Dict[str, Any]:
+                                     days: int = 3, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Create forecasts for multiple locations
         
+        Historical data is loaded sequentially on the calling thread (the database
+        session is not thread-safe); model fitting is fanned out to a thread pool.
+        
         Args:
             locations: List of (latitude, longitude) tuples
             days: Number of days to forecast
+            max_workers: Worker threads for model fitting (default: one per location, capped at CPU count)
             
         Returns:
             Dict with forecasts for all locations
         """
+        from ..database import WeatherRecord
+        
         results = {
             "forecasts": {},
             "summary": {
@@ -149,28 +274,47 @@ class ForecastManager:
             }
         }
         
-        for lat, lon in locations:
-            try:
+        if max_workers is None:
+            max_workers = min(len(locations), os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = []
+            for lat, lon in locations:
                 location_key = f"{lat:.2f},{lon:.2f}"
-                forecast = self.create_temperature_forecast(lat, lon, days)
-                
-                results["forecasts"][location_key] = forecast
-                
-                if "error" in forecast:
+                try:
+                    temp_series = WeatherRecord.get_temperature_series(lat, lon)
+                    futures.append((location_key, executor.submit(
+                        self._forecast_from_series, temp_series, lat, lon, days
+                    )))
+                except Exception as e:
+                    results["forecasts"][location_key] = {"error": str(e)}
                     results["summary"]["failed"] += 1
                     results["summary"]["errors"].append({
                         "location": location_key,
-                        "error": forecast["error"]
+                        "error": str(e)
                     })
-                else:
-                    results["summary"]["successful"] += 1
+            
+            for location_key, future in futures:
+                try:
+                    forecast = future.result()
                     
-            except Exception as e:
-                results["summary"]["failed"] += 1
-                results["summary"]["errors"].append({
-                    "location": f"{lat:.2f},{lon:.2f}",
-                    "error": str(e)
-                })
+                    results["forecasts"][location_key] = forecast
+                    
+                    if "error" in forecast:
+                        results["summary"]["failed"] += 1
+                        results["summary"]["errors"].append({
+                            "location": location_key,
+                            "error": forecast["error"]
+                        })
+                    else:
+                        results["summary"]["successful"] += 1
+                        
+                except Exception as e:
+                    results["summary"]["failed"] += 1
+                    results["summary"]["errors"].append({
+                        "location": location_key,
+                        "error": str(e)
+                    })
         
         success_rate = (results["summary"]["successful"] / len(locations)) * 100
         results["summary"]["success_rate"] = success_rate
@@ -179,6 +323,216 @@ class ForecastManager:
         
         return results
     
+    def create_joint_forecast(self, locations: List[Tuple[float, float]], days: int = 3,
+                              historical_days: int = 30, temp_type: str = 'avg',
+                              max_lags: int = 3, confidence_level: float = 0.95) -> Dict[str, Any]:
+        """
+        Create forecasts for multiple locations with a single VAR model
+        
+        All location series are aligned on date into one matrix and fitted
+        jointly, so nearby stations share one estimation instead of N ARIMA
+        fits. Falls back to per-location ARIMA on the already loaded series when
+        statsmodels is unavailable, fewer than two locations have usable data
+        or the VAR cannot be fitted.
+        
+        Locations that round to the same key (2 decimals) are forecast once.
+        The lag order is capped so the aligned history has at least
+        3 * lags * locations rows; e.g. 30 days for 4 locations allows 2 lags,
+        and if not even one lag fits the per-location fallback is used.
+        
+        Args:
+            locations: List of (latitude, longitude) tuples
+            days: Number of days to forecast
+            historical_days: Days of historical data to use
+            temp_type: Type of temperature ('avg', 'max', 'min')
+            max_lags: Maximum VAR lag order considered (capped to fit the history)
+            confidence_level: Confidence level for prediction intervals
+            
+        Returns:
+            Dict with forecasts for all locations (same shape as create_multi_location_forecast)
+        """
+        from ..database import WeatherRecord
+        
+        # One entry per location key; later duplicates would overwrite earlier ones
+        unique_locations = {}
+        for lat, lon in locations:
+            unique_locations.setdefault(f"{lat:.2f},{lon:.2f}", (lat, lon))
+        
+        results = {
+            "forecasts": {},
+            "summary": {
+                "total_locations": len(unique_locations),
+                "successful": 0,
+                "failed": 0,
+                "errors": []
+            }
+        }
+        
+        series_by_location = {}
+        coordinates = {}
+        for location_key, (lat, lon) in unique_locations.items():
+            try:
+                temp_series = WeatherRecord.get_temperature_series(lat, lon, historical_days, temp_type)
+            except Exception as e:
+                results["forecasts"][location_key] = {
+                    "error": str(e),
+                    "location": {"latitude": lat, "longitude": lon}
+                }
+                results["summary"]["failed"] += 1
+                results["summary"]["errors"].append({"location": location_key, "error": str(e)})
+                continue
+            
+            if len(temp_series) < self.min_data_points:
+                forecast = {
+                    "error": f"Insufficient data: {len(temp_series)} points (minimum {self.min_data_points} required)",
+                    "location": {"latitude": lat, "longitude": lon}
+                }
+                results["forecasts"][location_key] = forecast
+                results["summary"]["failed"] += 1
+                results["summary"]["errors"].append({"location": location_key, "error": forecast["error"]})
+                continue
+            
+            series_by_location[location_key] = temp_series.groupby(level=0).mean()
+            coordinates[location_key] = (lat, lon)
+        
+        if not STATSMODELS_AVAILABLE or len(series_by_location) < 2:
+            return self._forecast_locations_separately(results, series_by_location, coordinates,
+                                                       days, temp_type)
+        
+        # One column per location, aligned on date and forward-filled over gaps
+        data = pd.concat(series_by_location, axis=1).sort_index().ffill().dropna()
+        max_lags = min(max_lags, len(data) // (3 * data.shape[1]))
+        if max_lags < 1:
+            logger.info("Not enough aligned history for a joint VAR, falling back to per-location ARIMA")
+            return self._forecast_locations_separately(results, series_by_location, coordinates,
+                                                       days, temp_type)
+        
+        from statsmodels.tsa.api import VAR
+        
+        try:
+            fitted = VAR(data.to_numpy(dtype=np.float64)).fit(maxlags=max_lags, ic='aic')
+            lag_order = max(fitted.k_ar, 1)
+            if fitted.k_ar == 0:
+                fitted = VAR(data.to_numpy(dtype=np.float64)).fit(lag_order)
+            
+            point, lower, upper = fitted.forecast_interval(
+                data.to_numpy(dtype=np.float64)[-lag_order:], steps=days, alpha=1 - confidence_level
+            )
+        except Exception as e:
+            logger.warning(f"Joint VAR fit failed ({e}), falling back to per-location ARIMA")
+            return self._forecast_locations_separately(results, series_by_location, coordinates,
+                                                       days, temp_type)
+        
+        future_dates = pd.date_range(
+            start=data.index[-1] + pd.Timedelta(days=1), periods=days, freq='D'
+        ).strftime('%Y-%m-%d').tolist()
+        generated_at = datetime.utcnow().isoformat()
+        
+        for column, location_key in enumerate(data.columns):
+            lat, lon = coordinates[location_key]
+            history = data[location_key].to_numpy(dtype=np.float64)
+            forecast_values = point[:, column]
+            
+            forecast_data = [
+                {
+                    "date": future_dates[i],
+                    "forecast_temp": round(float(forecast_values[i]), 1),
+                    "lower_bound": round(float(lower[i, column]), 1),
+                    "upper_bound": round(float(upper[i, column]), 1),
+                    "confidence_level": confidence_level
+                }
+                for i in range(days)
+            ]
+            
+            results["forecasts"][location_key] = {
+                "forecast_data": forecast_data,
+                "forecast_statistics": {
+                    "forecast_mean": float(forecast_values.mean()),
+                    "forecast_std": float(forecast_values.std(ddof=1)) if days > 1 else float('nan'),
+                    "historical_mean": float(history.mean()),
+                    "historical_std": float(history.std(ddof=1)),
+                    "trend_direction": "increasing" if forecast_data[-1]["forecast_temp"] > forecast_data[0]["forecast_temp"] else "decreasing"
+                },
+                "model_info": {
+                    "model_type": "VAR",
+                    "var_lag_order": lag_order,
+                    "aic": float(fitted.aic),
+                    "confidence_level": confidence_level,
+                    "forecast_horizon": days,
+                    "joint_locations": len(data.columns)
+                },
+                "metadata": {
+                    "forecast_generated_at": generated_at,
+                    "data_points_used": len(data),
+                    "data_date_range": {
+                        "start": data.index.min().strftime('%Y-%m-%d'),
+                        "end": data.index.max().strftime('%Y-%m-%d')
+                    }
+                },
+                "location": {"latitude": lat, "longitude": lon},
+                "temperature_type": temp_type
+            }
+            results["summary"]["successful"] += 1
+        
+        success_rate = (results["summary"]["successful"] / results["summary"]["total_locations"]) * 100
+        results["summary"]["success_rate"] = success_rate
+        
+        logger.info(f"Joint VAR forecast for {len(data.columns)} locations: {success_rate:.1f}% success rate")
+        
+        return results
+    
+    def _forecast_locations_separately(self, results: Dict[str, Any],
+                                       series_by_location: Dict[str, pd.Series],
+                                       coordinates: Dict[str, Tuple[float, float]],
+                                       days: int, temp_type: str) -> Dict[str, Any]:
+        """
+        Fit one ARIMA per location from already loaded series and merge into results
+        
+        Used as the create_joint_forecast fallback, so entries already in results
+        (e.g. insufficient data) are kept and the database is not queried again.
+        
+        Args:
+            results: Partially filled create_joint_forecast result
+            series_by_location: Location key -> temperature series
+            coordinates: Location key -> (latitude, longitude)
+            days: Number of days to forecast
+            temp_type: Type of temperature ('avg', 'max', 'min')
+            
+        Returns:
+            Dict with forecasts for all locations (same shape as create_multi_location_forecast)
+        """
+        summary = results["summary"]
+        
+        if series_by_location:
+            max_workers = min(len(series_by_location), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [
+                    (location_key, executor.submit(
+                        self._forecast_from_series, temp_series, *coordinates[location_key], days, temp_type
+                    ))
+                    for location_key, temp_series in series_by_location.items()
+                ]
+                
+                for location_key, future in futures:
+                    try:
+                        forecast = future.result()
+                    except Exception as e:
+                        forecast = {"error": str(e)}
+                    
+                    results["forecasts"][location_key] = forecast
+                    if "error" in forecast:
+                        summary["failed"] += 1
+                        summary["errors"].append({"location": location_key, "error": forecast["error"]})
+                    else:
+                        summary["successful"] += 1
+        
+        success_rate = (summary["successful"] / summary["total_locations"]) * 100 if summary["total_locations"] else 0.0
+        summary["success_rate"] = success_rate
+        
+        logger.info(f"Per-location forecast fallback: {success_rate:.1f}% success rate")
+        
+        return results
+    
     def get_forecast_performance(self, latitude: float, longitude: float,
                                days_back: int = 7) -> Dict[str, Any]:
         """
@@ -195,23 +549,24 @@ class ForecastManager:
         try:
             from ..database import WeatherRecord
             
-            # Get recent historical data
-            historical_data = WeatherRecord.get_historical_for_location(
+            # Get recent historical data as parallel date/temperature arrays
+            dates, temps = WeatherRecord.get_historical_arrays(
                 latitude, longitude, days=days_back + 30
             )
             
-            if len(historical_data) < days_back + self.min_data_points:
+            if len(dates) < days_back + self.min_data_points:
                 return {"error": "Insufficient data for performance analysis"}
             
             # Split data: use older data for training, recent data for comparison
-            split_point = len(historical_data) - days_back
-            training_data = historical_data[:split_point]
-            actual_data = historical_data[split_point:]
+            split_point = len(dates) - days_back
+            training_dates, training_temps = dates[:split_point], temps[:split_point]
+            actual_dates, actual_temps = dates[split_point:], temps[split_point:]
             
-            # Create time series from training data
+            # Create time series from training data, masking missing temperatures
+            training_mask = ~np.isnan(training_temps)
             training_series = pd.Series(
-                [r.current_temp_c for r in training_data if r.current_temp_c is not None],
-                index=pd.to_datetime([r.date for r in training_data if r.current_temp_c is not None])
+                training_temps[training_mask],
+                index=pd.DatetimeIndex(training_dates[training_mask])
             )
             
             if len(training_series) < self.min_data_points:
@@ -225,14 +580,13 @@ class ForecastManager:
             if not forecaster.fit_model():
                 return {"error": "Failed to fit model for performance analysis"}
             
-            forecast_result = forecaster.generate_forecast(steps=len(actual_data))
+            forecast_result = forecaster.generate_forecast(steps=len(actual_dates))
             
             if "error" in forecast_result:
                 return forecast_result
             
             # Compare with actual data
-            actual_temps = [r.current_temp_c for r in actual_data if r.current_temp_c is not None]
-            actual_series = pd.Series(actual_temps)
+            actual_series = pd.Series(actual_temps[~np.isnan(actual_temps)])
             
             # Generate comprehensive report
             performance_report = generate_forecast_report(forecast_result, actual_series)
@@ -240,9 +594,9 @@ class ForecastManager:
             return {
                 "performance_report": performance_report,
                 "forecast_period": {
-                    "start": actual_data[0].date,
-                    "end": actual_data[-1].date,
-                    "days": len(actual_data)
+                    "start": str(np.datetime_as_string(actual_dates[0], unit='D')),
+                    "end": str(np.datetime_as_string(actual_dates[-1], unit='D')),
+                    "days": len(actual_dates)
                 },
                 "model_info": forecaster.get_model_summary()
             }
@@ -263,7 +617,150 @@ class ForecastManager:
             WeatherForecaster instance or None
         """
         location_key = f"{latitude:.2f},{longitude:.2f}"
-        return self.forecasters.get(location_key)
+        with self._cache_lock:
+            forecaster = self.forecasters.get(location_key)
+            if forecaster is not None:
+                self.forecasters.move_to_end(location_key)
+        
+        if forecaster is None:
+            forecaster = self._load_persisted_forecaster(location_key)
+            if forecaster is not None:
+                self._cache_forecaster(location_key, forecaster)
+        
+        return forecaster
+    
+    def _cache_forecaster(self, location_key: str, forecaster: WeatherForecaster):
+        """
+        Store a fitted forecaster, evicting the least recently used entry when full
+        
+        Args:
+            location_key: Location cache key
+            forecaster: Fitted WeatherForecaster
+        """
+        with self._cache_lock:
+            self.forecasters[location_key] = forecaster
+            self.forecasters.move_to_end(location_key)
+            while len(self.forecasters) > self.max_cache_size:
+                evicted_key, _ = self.forecasters.popitem(last=False)
+                logger.debug(f"Evicted cached forecaster for {evicted_key}")
+    
+    def _get_cached_result(self, result_key: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a cached forecast result if it has not expired
+        
+        Args:
+            result_key: (latitude, longitude, days, temp_type, data hash)
+            
+        Returns:
+            Forecast result dict or None
+        """
+        with self._cache_lock:
+            entry = self._result_cache.get(result_key)
+            if entry is None:
+                return None
+            timestamp, result = entry
+            if time.time() - timestamp > self.RESULT_CACHE_TTL:
+                del self._result_cache[result_key]
+                return None
+            self._result_cache.move_to_end(result_key)
+        return copy.deepcopy(result)
+    
+    def _cache_result(self, result_key: Tuple, result: Dict[str, Any]):
+        """
+        Store a forecast result, evicting the least recently used entry when full
+        
+        Args:
+            result_key: (latitude, longitude, days, temp_type, data hash)
+            result: Forecast result dict
+        """
+        entry = (time.time(), copy.deepcopy(result))
+        with self._cache_lock:
+            self._result_cache[result_key] = entry
+            self._result_cache.move_to_end(result_key)
+            while len(self._result_cache) > self.max_cache_size:
+                self._result_cache.popitem(last=False)
+    
+    @staticmethod
+    def _data_hash(series: pd.Series) -> str:
+        """Hash the dates and values of a prepared series for cache invalidation"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(series.index.asi8.tobytes())
+        digest.update(series.to_numpy(dtype=np.float64).tobytes())
+        return digest.hexdigest()
+    
+    def _cache_paths(self, location_key: str) -> Tuple[Path, Path]:
+        """Get the (pickle, metadata) paths for a persisted forecaster"""
+        return (self.cache_dir / f"{location_key}.pkl",
+                self.cache_dir / f"{location_key}.json")
+    
+    def _read_cache_metadata(self, location_key: str) -> Optional[Dict[str, Any]]:
+        """Read the sidecar metadata of a persisted forecaster, if any"""
+        if self.cache_dir is None:
+            return None
+        
+        _, meta_path = self._cache_paths(location_key)
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable forecast cache metadata for {location_key}: {e}")
+            return None
+    
+    def _persist_forecaster(self, location_key: str, forecaster: WeatherForecaster, data_hash: str):
+        """
+        Write a fitted forecaster and its metadata to the cache directory
+        
+        Args:
+            location_key: Location cache key
+            forecaster: Fitted WeatherForecaster
+            data_hash: Hash of the data the model was fitted on
+        """
+        if self.cache_dir is None:
+            return
+        
+        model_path, meta_path = self._cache_paths(location_key)
+        try:
+            with open(model_path, 'wb') as f:
+                pickle.dump(forecaster, f, protocol=5)
+            
+            with open(meta_path, 'w') as f:
+                json.dump({
+                    "order": list(forecaster.fitted_model.model.order),
+                    "n_points": len(forecaster.data_series),
+                    "ts_last": time.time(),
+                    "data_hash": data_hash
+                }, f)
+        except Exception as e:
+            logger.warning(f"Failed to persist forecaster for {location_key}: {e}")
+    
+    def _load_persisted_forecaster(self, location_key: str,
+                                   data_hash: Optional[str] = None) -> Optional[WeatherForecaster]:
+        """
+        Load a persisted forecaster from the cache directory
+        
+        Args:
+            location_key: Location cache key
+            data_hash: If given, only return the forecaster when it was fitted on this data
+            
+        Returns:
+            WeatherForecaster instance or None
+        """
+        metadata = self._read_cache_metadata(location_key)
+        if metadata is None:
+            return None
+        
+        if data_hash is not None and metadata.get("data_hash") != data_hash:
+            return None
+        
+        model_path, _ = self._cache_paths(location_key)
+        try:
+            with open(model_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load persisted forecaster for {location_key}: {e}")
+            return None
     
     def clear_forecaster_cache(self, latitude: float = None, longitude: float = None):
         """
@@ -275,10 +772,24 @@ class ForecastManager:
         """
         if latitude is not None and longitude is not None:
             location_key = f"{latitude:.2f},{longitude:.2f}"
-            self.forecasters.pop(location_key, None)
+            with self._cache_lock:
+                self.forecasters.pop(location_key, None)
+                for result_key in [key for key in self._result_cache
+                                   if f"{key[0]:.2f},{key[1]:.2f}" == location_key]:
+                    del self._result_cache[result_key]
+                self._order_cache.pop(location_key, None)
+            if self.cache_dir is not None:
+                for path in self._cache_paths(location_key):
+                    path.unlink(missing_ok=True)
             logger.info(f"Cleared forecaster cache for {location_key}")
         else:
-            self.forecasters.clear()
+            with self._cache_lock:
+                self.forecasters.clear()
+                self._result_cache.clear()
+                self._order_cache.clear()
+            if self.cache_dir is not None:
+                for path in list(self.cache_dir.glob("*.pkl")) + list(self.cache_dir.glob("*.json")):
+                    path.unlink(missing_ok=True)
             logger.info("Cleared all forecaster cache")
     
     def get_manager_stats(self) -> Dict[str, Any]:
@@ -290,6 +801,9 @@ class ForecastManager:
         """
         return {
             "cached_forecasters": len(self.forecasters),
+            "max_cache_size": self.max_cache_size,
             "cached_locations": list(self.forecasters.keys()),
-            "min_data_points": self.min_data_points
+            "cached_orders": len(self._order_cache),
+            "min_data_points": self.min_data_points,
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None
         }
\ No newline at end of file
@@ -6,10 +6,32 @@ Functions for calculating forecast performance and accuracy
 import numpy as np
 import pandas as pd
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any
 
 logger = logging.getLogger(__name__)
 
+# Index of each season in (month % 12) // 3
+SEASON_IDS = {'Winter': 0, 'Spring': 1, 'Summer': 2, 'Autumn': 3}
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two 1-D arrays without building a covariance matrix; NaN when either is constant"""
+    # Centered dot products avoid the cancellation of raw sums on large offsets
+    xc = x - x.mean()
+    yc = y - y.mean()
+    denominator = np.sqrt(np.dot(xc, xc) * np.dot(yc, yc))
+    if not denominator > 0:
+        return float('nan')
+    return float(np.dot(xc, yc) / denominator)
+
+
+def _rmse(forecast_array: np.ndarray, actual_array: np.ndarray) -> float:
+    """Root mean squared error over the common length of two arrays"""
+    min_length = min(len(forecast_array), len(actual_array))
+    errors = np.subtract(forecast_array[:min_length], actual_array[:min_length])
+    return float(np.sqrt(np.dot(errors, errors) / min_length))
+
 
 def calculate_forecast_accuracy(forecast_values: List[float], actual_values: List[float]) -> Dict[str, float]:
     """
@@ -25,64 +47,78 @@ def calculate_forecast_accuracy(forecast_values: List[float], actual_values: Lis
     try:
         # Ensure same length
         min_length = min(len(forecast_values), len(actual_values))
-        forecast_array = np.array(forecast_values[:min_length])
-        actual_array = np.array(actual_values[:min_length])
-        
-        # Calculate errors
-        errors = actual_array - forecast_array
-        abs_errors = np.abs(errors)
-        squared_errors = errors**2
-        
-        # Basic metrics
-        mae = np.mean(abs_errors)  # Mean Absolute Error
-        mse = np.mean(squared_errors)  # Mean Squared Error
-        rmse = np.sqrt(mse)  # Root Mean Squared Error
-        
-        # Percentage errors (avoid division by zero)
-        non_zero_actual = actual_array[actual_array != 0]
-        non_zero_forecast = forecast_array[actual_array != 0]
-        
-        if len(non_zero_actual) > 0:
-            percentage_errors = np.abs((non_zero_actual - non_zero_forecast) / non_zero_actual) * 100
-            mape = np.mean(percentage_errors)  # Mean Absolute Percentage Error
-        else:
-            mape = float('inf')
+        forecast_array = np.asarray(forecast_values, dtype=np.float64)[:min_length]
+        actual_array = np.asarray(actual_values, dtype=np.float64)[:min_length]
         
-        # Symmetric MAPE (handles zeros better)
-        smape = np.mean(2 * abs_errors / (np.abs(actual_array) + np.abs(forecast_array))) * 100
-        
-        # Mean Bias Error
-        mbe = np.mean(errors)
-        
-        # Correlation coefficient
-        correlation = np.corrcoef(forecast_array, actual_array)[0, 1] if len(forecast_array) > 1 else 0
-        
-        # Theil's U statistic
-        if len(actual_array) > 1:
-            naive_forecast = actual_array[:-1]  # Use previous value as naive forecast
-            naive_errors = actual_array[1:] - naive_forecast
-            naive_mse = np.mean(naive_errors**2)
-            theils_u = rmse / np.sqrt(naive_mse) if naive_mse > 0 else float('inf')
-        else:
-            theils_u = float('inf')
-        
-        return {
-            "mae": float(mae),
-            "mse": float(mse),
-            "rmse": float(rmse),
-            "mape": float(mape),
-            "smape": float(smape),
-            "mbe": float(mbe),
-            "correlation": float(correlation),
-            "theils_u": float(theils_u),
-            "sample_size": min_length
-        }
+        return _accuracy_core(forecast_array, actual_array)
         
     except Exception as e:
         logger.error(f"Error calculating forecast accuracy: {e}")
         return {"error": str(e)}
 
 
+def _accuracy_core(forecast_array: np.ndarray, actual_array: np.ndarray,
+                   naive_mse: float = None) -> Dict[str, float]:
+    """
+    Accuracy metrics for aligned float64 arrays of equal length
+    
+    Args:
+        forecast_array: Predicted values
+        actual_array: Actual observed values
+        naive_mse: Precomputed persistence-forecast MSE of actual_array (for Theil's U)
+        
+    Returns:
+        Dict with accuracy metrics
+    """
+    # Calculate errors (each intermediate is computed once and reused)
+    errors = actual_array - forecast_array
+    abs_errors = np.abs(errors)
+    abs_actual = np.abs(actual_array)
+    
+    # Basic metrics
+    mae = np.mean(abs_errors)  # Mean Absolute Error
+    mse = np.dot(errors, errors) / errors.size  # Mean Squared Error
+    rmse = np.sqrt(mse)  # Root Mean Squared Error
+    
+    # Percentage errors (avoid division by zero): |a - f| / |a| on non-zero actuals
+    non_zero = abs_actual != 0
+    
+    if np.any(non_zero):
+        mape = np.mean(abs_errors[non_zero] / abs_actual[non_zero]) * 100  # Mean Absolute Percentage Error
+    else:
+        mape = float('inf')
+    
+    # Symmetric MAPE (handles zeros better)
+    smape = np.mean(2 * abs_errors / (abs_actual + np.abs(forecast_array))) * 100
+    
+    # Mean Bias Error
+    mbe = np.mean(errors)
+    
+    # Correlation coefficient
+    correlation = _pearson(forecast_array, actual_array) if len(forecast_array) > 1 else 0
+    
+    # Theil's U statistic
+    if len(actual_array) > 1:
+        if naive_mse is None:
+            naive_errors = np.diff(actual_array)  # Use previous value as naive forecast
+            naive_mse = np.dot(naive_errors, naive_errors) / naive_errors.size
+        theils_u = rmse / np.sqrt(naive_mse) if naive_mse > 0 else float('inf')
+    else:
+        theils_u = float('inf')
+    
+    return {
+        "mae": float(mae),
+        "mse": float(mse),
+        "rmse": float(rmse),
+        "mape": float(mape),
+        "smape": float(smape),
+        "mbe": float(mbe),
+        "correlation": float(correlation),
+        "theils_u": float(theils_u),
+        "sample_size": len(actual_array)
+    }
+
+
 def calculate_directional_accuracy(forecast_values: List[float], actual_values: List[float]) -> Dict[str, Any]:
     """
     Calculate directional accuracy (whether forecast correctly predicts direction of change)
@@ -98,28 +134,31 @@ def calculate_directional_accuracy(forecast_values: List[float], actual_values:
         if len(forecast_values) < 2 or len(actual_values) < 2:
             return {"error": "Insufficient data for directional accuracy"}
         
-        # Calculate changes
-        forecast_changes = np.diff(forecast_values)
-        actual_changes = np.diff(actual_values)
+        # Calculate changes over the common length
+        min_length = min(len(forecast_values), len(actual_values))
+        forecast_changes = np.diff(np.asarray(forecast_values, dtype=np.float64)[:min_length])
+        actual_changes = np.diff(np.asarray(actual_values, dtype=np.float64)[:min_length])
         
-        # Determine directions (up, down, no change)
-        forecast_directions = np.sign(forecast_changes)
-        actual_directions = np.sign(actual_changes)
+        # Determine directions (up, down, no change) as boolean masks, without np.sign
+        forecast_up = forecast_changes > 0
+        forecast_down = forecast_changes < 0
+        actual_up = actual_changes > 0
+        actual_down = actual_changes < 0
         
-        # Count correct directions
-        correct_directions = np.sum(forecast_directions == actual_directions)
-        total_changes = len(forecast_directions)
+        # Directions agree when both the "up" and the "down" flags match
+        correct_directions = np.count_nonzero((forecast_up == actual_up) & (forecast_down == actual_down))
+        total_changes = len(forecast_changes)
         
         directional_accuracy = correct_directions / total_changes if total_changes > 0 else 0
         
         # Detailed breakdown
-        up_predicted = np.sum(forecast_directions > 0)
-        down_predicted = np.sum(forecast_directions < 0)
-        no_change_predicted = np.sum(forecast_directions == 0)
+        up_predicted = np.count_nonzero(forecast_up)
+        down_predicted = np.count_nonzero(forecast_down)
+        no_change_predicted = total_changes - up_predicted - down_predicted
         
-        up_actual = np.sum(actual_directions > 0)
-        down_actual = np.sum(actual_directions < 0)
-        no_change_actual = np.sum(actual_directions == 0)
+        up_actual = np.count_nonzero(actual_up)
+        down_actual = np.count_nonzero(actual_down)
+        no_change_actual = total_changes - up_actual - down_actual
         
         return {
             "directional_accuracy": float(directional_accuracy),
@@ -158,17 +197,15 @@ def calculate_forecast_intervals_coverage(forecast_data: List[Dict], actual_valu
             return {"error": "No data provided"}
         
         total_forecasts = min(len(forecast_data), len(actual_values))
-        within_intervals = 0
+        window = forecast_data[:total_forecasts]
         
-        for i in range(total_forecasts):
-            forecast = forecast_data[i]
-            actual = actual_values[i]
-            
-            lower_bound = forecast.get('lower_bound', float('-inf'))
-            upper_bound = forecast.get('upper_bound', float('inf'))
-            
-            if lower_bound <= actual <= upper_bound:
-                within_intervals += 1
+        lower = np.fromiter((item.get('lower_bound', -np.inf) for item in window),
+                            dtype=np.float64, count=total_forecasts)
+        upper = np.fromiter((item.get('upper_bound', np.inf) for item in window),
+                            dtype=np.float64, count=total_forecasts)
+        actual = np.asarray(actual_values, dtype=np.float64)[:total_forecasts]
+        
+        within_intervals = np.count_nonzero((actual >= lower) & (actual <= upper))
         
         coverage_rate = within_intervals / total_forecasts if total_forecasts > 0 else 0
         
@@ -261,6 +298,7 @@ def generate_forecast_report(forecast_results: Dict[str, Any], actual_data: pd.S
         return {"error": str(e)}
 
 
+@lru_cache(maxsize=128)
 def get_performance_recommendation(mae: float, correlation: float) -> str:
     """
     Get recommendation based on performance metrics
@@ -296,32 +334,42 @@ def compare_forecast_methods(forecasts_dict: Dict[str, List[float]],
     """
     try:
         comparison_results = {}
+        actual_array = np.asarray(actual_values, dtype=np.float64)  # Convert once for all methods
         
-        for method_name, forecast_values in forecasts_dict.items():
-            accuracy_metrics = calculate_forecast_accuracy(forecast_values, actual_values)
-            comparison_results[method_name] = accuracy_metrics
-        
-        # Find best method based on RMSE
-        best_method = None
-        best_rmse = float('inf')
+        # The persistence baseline for Theil's U only depends on the actual values
+        naive_errors = np.diff(actual_array)
+        full_naive_mse = np.dot(naive_errors, naive_errors) / naive_errors.size if len(naive_errors) > 0 else None
         
-        for method_name, metrics in comparison_results.items():
-            if "error" not in metrics:
-                rmse = metrics.get("rmse", float('inf'))
-                if rmse < best_rmse:
-                    best_rmse = rmse
-                    best_method = method_name
+        for method_name, forecast_values in forecasts_dict.items():
+            try:
+                forecast_array = np.asarray(forecast_values, dtype=np.float64)
+                min_length = min(len(forecast_array), len(actual_array))
+                naive_mse = full_naive_mse if min_length == len(actual_array) else None
+                comparison_results[method_name] = _accuracy_core(
+                    forecast_array[:min_length], actual_array[:min_length], naive_mse
+                )
+            except Exception as e:
+                logger.error(f"Error calculating forecast accuracy for {method_name}: {e}")
+                comparison_results[method_name] = {"error": str(e)}
+        
+        # Rank methods by RMSE; the best method is the head of the ranking
+        ranking = sorted(
+            [(name, metrics.get("rmse", float('inf')))
+             for name, metrics in comparison_results.items()
+             if "error" not in metrics],
+            key=lambda x: x[1]
+        )
+        
+        if ranking and ranking[0][1] < float('inf'):
+            best_method, best_rmse = ranking[0]
+        else:
+            best_method, best_rmse = None, float('inf')
         
         return {
             "individual_results": comparison_results,
             "best_method": best_method,
             "best_rmse": best_rmse,
-            "ranking": sorted(
-                [(name, metrics.get("rmse", float('inf'))) 
-                 for name, metrics in comparison_results.items() 
-                 if "error" not in metrics],
-                key=lambda x: x[1]
-            )
+            "ranking": ranking
         }
         
     except Exception as e:
@@ -344,34 +392,23 @@ def calculate_seasonal_accuracy(forecast_values: List[float],
         Dict with seasonal accuracy metrics
     """
     try:
-        import pandas as pd
-        
-        # Create DataFrame
-        df = pd.DataFrame({
-            'forecast': forecast_values,
-            'actual': actual_values,
-            'date': pd.to_datetime(dates)
-        })
-        
-        # Add season column
-        df['season'] = df['date'].dt.month.map({
-            12: 'Winter', 1: 'Winter', 2: 'Winter',
-            3: 'Spring', 4: 'Spring', 5: 'Spring',
-            6: 'Summer', 7: 'Summer', 8: 'Summer',
-            9: 'Autumn', 10: 'Autumn', 11: 'Autumn'
-        })
+        forecast_array = np.asarray(forecast_values, dtype=np.float64)
+        actual_array = np.asarray(actual_values, dtype=np.float64)
+        
+        if not len(forecast_array) == len(actual_array) == len(dates):
+            raise ValueError("forecast_values, actual_values and dates must have the same length")
+        
+        # Meteorological season per date: Dec-Feb -> 0, Mar-May -> 1, Jun-Aug -> 2, Sep-Nov -> 3
+        months = pd.to_datetime(dates).month.to_numpy()
+        season_ids = (months % 12) // 3
         
         seasonal_results = {}
         
         for season in ['Spring', 'Summer', 'Autumn', 'Winter']:
-            season_data = df[df['season'] == season]
+            mask = season_ids == SEASON_IDS[season]
             
-            if len(season_data) > 0:
-                seasonal_accuracy = calculate_forecast_accuracy(
-                    season_data['forecast'].tolist(),
-                    season_data['actual'].tolist()
-                )
-                seasonal_results[season] = seasonal_accuracy
+            if np.any(mask):
+                seasonal_results[season] = _accuracy_core(forecast_array[mask], actual_array[mask])
             else:
                 seasonal_results[season] = {"error": "No data for this season"}
         
@@ -397,20 +434,20 @@ def calculate_forecast_skill_score(forecast_values: List[float],
         Dict with skill scores
     """
     try:
-        # Calculate RMSE for main forecast
-        main_metrics = calculate_forecast_accuracy(forecast_values, actual_values)
-        main_rmse = main_metrics.get("rmse", float('inf'))
+        actual_array = np.asarray(actual_values, dtype=np.float64)
+        
+        # Calculate RMSE for main forecast (only RMSE is needed here)
+        main_rmse = _rmse(np.asarray(forecast_values, dtype=np.float64), actual_array)
         
         # If no reference provided, use persistence (previous value)
         if reference_forecast is None:
-            if len(actual_values) > 1:
-                reference_forecast = [actual_values[0]] + actual_values[:-1]
+            if len(actual_array) > 1:
+                reference_forecast = np.concatenate((actual_array[:1], actual_array[:-1]))
             else:
                 return {"error": "Insufficient data for skill score calculation"}
         
         # Calculate RMSE for reference forecast
-        ref_metrics = calculate_forecast_accuracy(reference_forecast, actual_values)
-        ref_rmse = ref_metrics.get("rmse", float('inf'))
+        ref_rmse = _rmse(np.asarray(reference_forecast, dtype=np.float64), actual_array)
         
         # Calculate skill score
         if ref_rmse > 0:
@@ -443,25 +480,27 @@ def analyze_forecast_bias(forecast_values: List[float], actual_values: List[floa
     """
     try:
         min_length = min(len(forecast_values), len(actual_values))
-        forecast_array = np.array(forecast_values[:min_length])
-        actual_array = np.array(actual_values[:min_length])
+        forecast_array = np.asarray(forecast_values, dtype=np.float64)[:min_length]
+        actual_array = np.asarray(actual_values, dtype=np.float64)[:min_length]
         
         errors = forecast_array - actual_array
         
         # Overall bias
         mean_bias = np.mean(errors)
         
-        # Bias by temperature range
-        low_temp_mask = actual_array < np.percentile(actual_array, 33)
-        mid_temp_mask = (actual_array >= np.percentile(actual_array, 33)) & (actual_array < np.percentile(actual_array, 67))
-        high_temp_mask = actual_array >= np.percentile(actual_array, 67)
-        
-        low_temp_bias = np.mean(errors[low_temp_mask]) if np.any(low_temp_mask) else 0
-        mid_temp_bias = np.mean(errors[mid_temp_mask]) if np.any(mid_temp_mask) else 0
-        high_temp_bias = np.mean(errors[high_temp_mask]) if np.any(high_temp_mask) else 0
+        # Bias by temperature range: bucket 0 (< p33), 1 (p33..p67), 2 (>= p67)
+        buckets = np.digitize(actual_array, np.percentile(actual_array, [33, 67]))
+        bucket_sums = np.bincount(buckets, weights=errors, minlength=3)
+        bucket_counts = np.bincount(buckets, minlength=3)
+        bucket_bias = np.where(bucket_counts > 0, bucket_sums / np.maximum(bucket_counts, 1), 0.0)
+        low_temp_bias, mid_temp_bias, high_temp_bias = bucket_bias
         
         # Bias trend over time
-        bias_trend = np.corrcoef(range(len(errors)), errors)[0, 1] if len(errors) > 1 else 0
+        n = len(errors)
+        if n > 1:
+            bias_trend = _pearson(np.arange(n, dtype=np.float64), errors)
+        else:
+            bias_trend = 0
         
         return {
             "overall_bias": float(mean_bias),
@@ -5,6 +5,8 @@ Helper functions for weather forecasting operations
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+from scipy.ndimage import uniform_filter1d
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Tuple, Optional
 
@@ -26,13 +28,12 @@ def create_synthetic_temperature_series(days: int = 30, base_temp: float = 20.0,
     """
     dates = pd.date_range(start=datetime.now() - timedelta(days=days), periods=days, freq='D')
     
-    # Create temperature components
-    trend_component = trend * np.arange(days)
-    seasonal_component = seasonality * np.sin(2 * np.pi * np.arange(days) / 365.25)
-    weekly_component = 2 * np.sin(2 * np.pi * np.arange(days) / 7)
-    noise_component = np.random.normal(0, noise_std, days)
-    
-    temperatures = base_temp + trend_component + seasonal_component + weekly_component + noise_component
+    # Start from base temperature plus noise, then add trend, seasonal and weekly components in place
+    t = np.arange(days, dtype=np.float64)
+    temperatures = np.random.normal(base_temp, noise_std, days)
+    temperatures += trend * t
+    temperatures += seasonality * np.sin((2 * np.pi / 365.25) * t)
+    temperatures += 2 * np.sin((2 * np.pi / 7) * t)
     
     return pd.Series(temperatures, index=dates)
 
@@ -65,24 +66,23 @@ def detect_outliers(data: pd.Series, method: str = 'iqr', factor: float = 1.5) -
         factor: Threshold factor for outlier detection
         
     Returns:
-        List of outlier indices
+        List of positional (integer) indices of outliers
     """
-    outlier_indices = []
+    values = np.asarray(data, dtype=np.float64)
     
     if method == 'iqr':
-        Q1 = data.quantile(0.25)
-        Q3 = data.quantile(0.75)
+        Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - factor * IQR
         upper_bound = Q3 + factor * IQR
         
-        outlier_indices = data[(data < lower_bound) | (data > upper_bound)].index.tolist()
+        return np.flatnonzero((values < lower_bound) | (values > upper_bound)).tolist()
         
     elif method == 'zscore':
-        z_scores = np.abs((data - data.mean()) / data.std())
-        outlier_indices = data[z_scores > factor].index.tolist()
+        z_scores = np.abs((values - np.nanmean(values)) / np.nanstd(values, ddof=1))
+        return np.flatnonzero(z_scores > factor).tolist()
     
-    return outlier_indices
+    return []
 
 
 def smooth_time_series(data: pd.Series, method: str = 'rolling', window: int = 3) -> pd.Series:
@@ -98,7 +98,25 @@ def smooth_time_series(data: pd.Series, method: str = 'rolling', window: int = 3
         Smoothed time series
     """
     if method == 'rolling':
-        return data.rolling(window=window, center=True).mean().fillna(data)
+        values = data.to_numpy(dtype=np.float64)
+        if window <= 1 or window > len(values):
+            return pd.Series(values, index=data.index)
+        
+        # Centered moving average (O(N) running sum); edges without a full
+        # window keep the raw values. A running sum would spread a NaN to every
+        # later point, so gappy series go through the windowed convolution.
+        if np.isnan(values).any():
+            smoothed = np.convolve(values, np.full(window, 1.0 / window), mode='same')
+        else:
+            smoothed = uniform_filter1d(values, size=window, mode='nearest')
+        head, tail = window // 2, (window - 1) // 2
+        smoothed[:head] = values[:head]
+        if tail:
+            smoothed[-tail:] = values[-tail:]
+        
+        missing = np.isnan(smoothed)
+        smoothed[missing] = values[missing]
+        return pd.Series(smoothed, index=data.index)
     elif method == 'ewm':
         return data.ewm(span=window).mean()
     else:
@@ -146,6 +164,18 @@ def calculate_seasonal_decomposition(data: pd.Series, period: int = 365) -> Dict
         }
 
 
+# Row template and header used by format_forecast_for_display
+_FORECAST_DISPLAY_HEADER = "Weather Forecast:\n" + "-" * 40 + "\n"
+_FORECAST_ROW_TEMPLATE = "{date}: {forecast_temp}°C ({lower_bound}°C - {upper_bound}°C)"
+
+
+class _ForecastDisplayRow(dict):
+    """Forecast item view that fills missing display fields with placeholders"""
+    
+    def __missing__(self, key: str) -> str:
+        return 'Unknown' if key == 'date' else 'N/A'
+
+
 def format_forecast_for_display(forecast_data: List[Dict[str, Any]]) -> str:
     """
     Format forecast data for human-readable display
@@ -159,18 +189,29 @@ def format_forecast_for_display(forecast_data: List[Dict[str, Any]]) -> str:
     if not forecast_data:
         return "No forecast data available"
     
-    lines = ["Weather Forecast:"]
-    lines.append("-" * 40)
-    
-    for item in forecast_data:
-        date = item.get('date', 'Unknown')
-        temp = item.get('forecast_temp', 'N/A')
-        lower = item.get('lower_bound', 'N/A')
-        upper = item.get('upper_bound', 'N/A')
-        
-        lines.append(f"{date}: {temp}°C ({lower}°C - {upper}°C)")
-    
-    return '\n'.join(lines)
+    format_row = _FORECAST_ROW_TEMPLATE.format_map
+    rows = '\n'.join([format_row(_ForecastDisplayRow(item)) for item in forecast_data])
+    return _FORECAST_DISPLAY_HEADER + rows
+
+
+# (predicate, message template) tables used by validate_forecast_inputs
+_INPUT_ERROR_RULES = [
+    (lambda v: not (-90 <= v["latitude"] <= 90),
+     "Invalid latitude: {latitude} (must be between -90 and 90)"),
+    (lambda v: not (-180 <= v["longitude"] <= 180),
+     "Invalid longitude: {longitude} (must be between -180 and 180)"),
+    (lambda v: v["days"] < 1,
+     "Invalid forecast days: {days} (must be >= 1)"),
+    (lambda v: v["historical_days"] < 10,
+     "Insufficient historical days: {historical_days} (minimum 10 required)"),
+]
+
+_INPUT_WARNING_RULES = [
+    (lambda v: v["days"] > 30,
+     "Long forecast horizon: {days} days (accuracy may be low)"),
+    (lambda v: 10 <= v["historical_days"] < 30,
+     "Limited historical data: {historical_days} days (30+ recommended)"),
+]
 
 
 def validate_forecast_inputs(latitude: float, longitude: float, days: int, 
@@ -187,26 +228,16 @@ def validate_forecast_inputs(latitude: float, longitude: float, days: int,
     Returns:
         Dict with validation results
     """
-    errors = []
-    warnings = []
-    
-    # Validate coordinates
-    if not (-90 <= latitude <= 90):
-        errors.append(f"Invalid latitude: {latitude} (must be between -90 and 90)")
-    
-    if not (-180 <= longitude <= 180):
-        errors.append(f"Invalid longitude: {longitude} (must be between -180 and 180)")
-    
-    # Validate forecast parameters
-    if days < 1:
-        errors.append(f"Invalid forecast days: {days} (must be >= 1)")
-    elif days > 30:
-        warnings.append(f"Long forecast horizon: {days} days (accuracy may be low)")
+    values = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "days": days,
+        "historical_days": historical_days
+    }
     
-    if historical_days < 10:
-        errors.append(f"Insufficient historical days: {historical_days} (minimum 10 required)")
-    elif historical_days < 30:
-        warnings.append(f"Limited historical data: {historical_days} days (30+ recommended)")
+    # Messages are only formatted for the rules that fail
+    errors = [message.format(**values) for check, message in _INPUT_ERROR_RULES if check(values)]
+    warnings = [message.format(**values) for check, message in _INPUT_WARNING_RULES if check(values)]
     
     return {
         "valid": len(errors) == 0,
@@ -234,6 +265,7 @@ def convert_temperature_units(temp_celsius: float, target_unit: str = 'fahrenhei
         return temp_celsius  # Return as-is for Celsius
 
 
+@lru_cache(maxsize=128)
 def get_forecast_confidence_description(confidence_level: float) -> str:
     """
     Get human-readable description of confidence level
@@ -269,21 +301,20 @@ def calculate_forecast_uncertainty(forecast_data: List[Dict[str, Any]]) -> Dict[
     if not forecast_data:
         return {"error": "No forecast data provided"}
     
-    uncertainties = []
-    for item in forecast_data:
-        lower = item.get('lower_bound')
-        upper = item.get('upper_bound')
-        
-        if lower is not None and upper is not None:
-            uncertainty = upper - lower
-            uncertainties.append(uncertainty)
+    bounded = [item for item in forecast_data
+               if item.get('lower_bound') is not None and item.get('upper_bound') is not None]
     
-    if uncertainties:
+    if bounded:
+        n = len(bounded)
+        lower = np.fromiter((item['lower_bound'] for item in bounded), dtype=np.float64, count=n)
+        upper = np.fromiter((item['upper_bound'] for item in bounded), dtype=np.float64, count=n)
+        uncertainties = upper - lower
+        
         return {
-            "mean_uncertainty": np.mean(uncertainties),
-            "max_uncertainty": np.max(uncertainties),
-            "min_uncertainty": np.min(uncertainties),
-            "uncertainty_trend": "increasing" if len(uncertainties) > 1 and uncertainties[-1] > uncertainties[0] else "stable"
+            "mean_uncertainty": float(uncertainties.mean()),
+            "max_uncertainty": float(uncertainties.max()),
+            "min_uncertainty": float(uncertainties.min()),
+            "uncertainty_trend": "increasing" if n > 1 and uncertainties[-1] > uncertainties[0] else "stable"
         }
     else:
         return {"error": "No valid uncertainty bounds found"}
\ No newline at end of file
@@ -3,18 +3,23 @@ Model Validation for Weather Forecasting
 Statistical tests and validation methods for ARIMA models
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, Any
-
-try:
-    from statsmodels.stats.diagnostic import acorr_ljungbox
-    STATSMODELS_AVAILABLE = True
-except ImportError:
-    STATSMODELS_AVAILABLE = False
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from scipy.special import chdtrc
 
 logger = logging.getLogger(__name__)
 
+# Ljung-Box p-values keyed on a hash of the residual vector, so re-validating
+# a reused model skips the autocovariance pass
+_LJUNG_BOX_CACHE_SIZE = 256
+_ljung_box_cache: "OrderedDict[tuple, float]" = OrderedDict()
+_ljung_box_lock = threading.Lock()
+
 
 def validate_arima_model(fitted_model) -> Dict[str, Any]:
     """
@@ -29,42 +34,230 @@ def validate_arima_model(fitted_model) -> Dict[str, Any]:
     if fitted_model is None:
         return {"error": "No model provided"}
     
-    if not STATSMODELS_AVAILABLE:
-        return {"error": "statsmodels not available for validation"}
-    
     try:
-        # Get residuals
-        residuals = fitted_model.resid
+        # Get residuals once as a plain array; the Series' index is never needed
+        resid_values = np.ascontiguousarray(np.asarray(fitted_model.resid, dtype=np.float64))
+        
+        # Center once; the std and the Ljung-Box autocovariances share it
+        n = len(resid_values)
+        resid_mean = resid_values.mean()
+        centered = resid_values - resid_mean
         
         # Ljung-Box test for residual autocorrelation
-        lb_test = acorr_ljungbox(residuals, lags=10, return_df=True)
+        lag = _ljung_box_lag(n)
+        lb_p_value = _ljung_box_p_value(centered, lag)
         
         # Residual statistics
         validation_results = {
-            "residual_mean": float(residuals.mean()),
-            "residual_std": float(residuals.std()),
-            "residual_min": float(residuals.min()),
-            "residual_max": float(residuals.max()),
-            "ljung_box_p_values": lb_test['lb_pvalue'].to_dict(),
+            "residual_mean": float(resid_mean),
+            "residual_std": float(np.sqrt(np.dot(centered, centered) / (n - 1))),
+            "residual_min": float(resid_values.min()),
+            "residual_max": float(resid_values.max()),
+            "ljung_box_p_values": {lag: lb_p_value},
             "model_aic": fitted_model.aic,
             "model_bic": fitted_model.bic,
             "log_likelihood": fitted_model.llf
         }
         
         # Check if residuals are white noise (good model)
-        significant_autocorr = (lb_test['lb_pvalue'] < 0.05).any()
+        significant_autocorr = lb_p_value < 0.05
         validation_results["has_autocorrelation"] = significant_autocorr
         validation_results["validation_status"] = "Poor" if significant_autocorr else "Good"
         
-        logger.info(f"Model validation: {validation_results['validation_status']}")
+        logger.info("Model validation: %s", validation_results["validation_status"])
         
         return validation_results
         
     except Exception as e:
-        logger.error(f"Error validating model: {e}")
+        logger.error("Error validating model: %s", e)
         return {"error": str(e)}
 
 
+def _ljung_box_lag(n: int) -> int:
+    """
+    Ljung-Box lag h = min(10, T/5), the non-seasonal rule from Hyndman &
+    Athanasopoulos, "Forecasting: Principles and Practice" (residual
+    diagnostics); larger h over-rejects on short series
+    
+    Args:
+        n: Number of residuals
+        
+    Returns:
+        Lag at which to evaluate Q
+    """
+    return min(10, max(1, n // 5))
+
+
+def _ljung_box(resid_values: np.ndarray, lags: int = 10,
+               demeaned: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ljung-Box Q statistics and p-values for lags 1..lags
+    
+    Same statistic as statsmodels' acorr_ljungbox (biased autocovariance,
+    no model degrees of freedom), computed with one dot product per lag
+    instead of building an ACF and a DataFrame. Works along the last axis,
+    so a (B, N) residual matrix is tested in a single pass.
+    
+    Args:
+        resid_values: Contiguous float64 residual array, 1-D or (B, N)
+        lags: Number of lags to test
+        demeaned: True if resid_values is already centered along the last axis
+        
+    Returns:
+        Tuple of (Q statistics, p-values), one entry per lag along the last axis
+    """
+    n = resid_values.shape[-1]
+    if demeaned:
+        centered = resid_values
+    else:
+        centered = resid_values - resid_values.mean(axis=-1, keepdims=True)
+    gamma0 = np.einsum('...i,...i->...', centered, centered)
+    
+    lag_range = np.arange(1, lags + 1)
+    autocov = np.stack(
+        [np.einsum('...i,...i->...', centered[..., k:], centered[..., :-k]) for k in lag_range],
+        axis=-1
+    )
+    rho = autocov / gamma0[..., np.newaxis]
+    
+    q_stats = n * (n + 2) * np.cumsum(rho * rho / (n - lag_range), axis=-1)
+    p_values = chdtrc(lag_range, q_stats)
+    return q_stats, p_values
+
+
+def _ljung_box_p_value(centered: np.ndarray, lag: int) -> float:
+    """
+    Ljung-Box p-value of the aggregated Q statistic at a single lag,
+    memoized on the residual bytes
+    
+    Args:
+        centered: Contiguous float64 residual array with its mean removed
+        lag: Lag at which Q is evaluated
+        
+    Returns:
+        p-value of Q(lag)
+    """
+    digest = hashlib.blake2b(centered.tobytes(), digest_size=16).digest()
+    key = (digest, len(centered), lag)
+    
+    with _ljung_box_lock:
+        cached = _ljung_box_cache.get(key)
+        if cached is not None:
+            _ljung_box_cache.move_to_end(key)
+            return cached
+    
+    _, lb_p = _ljung_box(centered, lag, demeaned=True)
+    p_value = float(lb_p[-1])
+    
+    with _ljung_box_lock:
+        _ljung_box_cache[key] = p_value
+        while len(_ljung_box_cache) > _LJUNG_BOX_CACHE_SIZE:
+            _ljung_box_cache.popitem(last=False)
+    
+    return p_value
+
+
+def _validate_residual_batch(residuals_2d: np.ndarray, lags: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Residual diagnostics for a stack of equal-length residual series; the
+    vectorized kernel behind validate_arima_models
+    
+    Uses the same single-lag Ljung-Box rule as validate_arima_model.
+    
+    Args:
+        residuals_2d: (B, N) array with one row of residuals per model
+        lags: Ljung-Box lag (default: _ljung_box_lag(N); capped at N - 1)
+        
+    Returns:
+        List of per-model dicts with the residual fields of validate_arima_model
+    """
+    try:
+        resid = np.ascontiguousarray(np.atleast_2d(np.asarray(residuals_2d, dtype=np.float64)))
+        n = resid.shape[1]
+        lag = _ljung_box_lag(n) if lags is None else max(1, min(lags, n - 1))
+        
+        means = resid.mean(axis=1)
+        centered = resid - means[:, np.newaxis]
+        stds = np.sqrt(np.einsum('bi,bi->b', centered, centered) / (n - 1))
+        mins = resid.min(axis=1)
+        maxs = resid.max(axis=1)
+        _, lb_p = _ljung_box(centered, lag, demeaned=True)
+        p_values = lb_p[:, -1].tolist()
+        
+        results = []
+        for b, p_value in enumerate(p_values):
+            significant_autocorr = p_value < 0.05
+            results.append({
+                "residual_mean": float(means[b]),
+                "residual_std": float(stds[b]),
+                "residual_min": float(mins[b]),
+                "residual_max": float(maxs[b]),
+                "ljung_box_p_values": {lag: p_value},
+                "has_autocorrelation": significant_autocorr,
+                "validation_status": "Poor" if significant_autocorr else "Good"
+            })
+        
+        logger.info("Batch validation: %d/%d models with autocorrelated residuals",
+                    sum(result["has_autocorrelation"] for result in results), len(results))
+        
+        return results
+        
+    except Exception as e:
+        logger.error("Error validating model batch: %s", e)
+        return [{"error": str(e)}]
+
+
+def validate_arima_models(fitted_models: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Validate several fitted ARIMA models, e.g. auto-selection candidates
+    
+    Residuals of equal length are stacked and diagnosed in one
+    _validate_residual_batch pass instead of one validate_arima_model call
+    per model. Each result has the same fields as validate_arima_model.
+    
+    Args:
+        fitted_models: Fitted ARIMA models from statsmodels
+        
+    Returns:
+        List of validation result dicts, in input order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(fitted_models)
+    
+    # Group models by residual length so each group stacks into a (B, N) matrix
+    groups: Dict[int, List[Tuple[int, np.ndarray]]] = {}
+    for i, model in enumerate(fitted_models):
+        if model is None:
+            results[i] = {"error": "No model provided"}
+            continue
+        try:
+            resid_values = np.asarray(model.resid, dtype=np.float64)
+            groups.setdefault(len(resid_values), []).append((i, resid_values))
+        except Exception as e:
+            logger.error("Error validating model: %s", e)
+            results[i] = {"error": str(e)}
+    
+    for members in groups.values():
+        indices = [i for i, _ in members]
+        batch = _validate_residual_batch(np.vstack([values for _, values in members]))
+        
+        if "error" in batch[0]:
+            # The batch failed as a whole and returned a single error entry
+            for i in indices:
+                results[i] = dict(batch[0])
+            continue
+        
+        for i, diagnostics in zip(indices, batch):
+            model = fitted_models[i]
+            results[i] = {
+                **diagnostics,
+                "model_aic": model.aic,
+                "model_bic": model.bic,
+                "log_likelihood": model.llf
+            }
+    
+    return results
+
+
 def check_residual_normality(fitted_model) -> Dict[str, Any]:
     """
     Check if model residuals are normally distributed
@@ -76,33 +269,38 @@ def check_residual_normality(fitted_model) -> Dict[str, Any]:
         Dict with normality test results
     """
     try:
-        residuals = fitted_model.resid
+        resid_arr = np.ascontiguousarray(np.asarray(fitted_model.resid, dtype=np.float64))
         
         # Basic normality checks
         from scipy import stats
         
-        # Shapiro-Wilk test (for small samples)
-        if len(residuals) <= 50:
-            shapiro_stat, shapiro_p = stats.shapiro(residuals)
+        # D'Agostino's K^2 combines skewness and kurtosis; its kurtosis
+        # z-score needs at least 20 points, so fall back to Shapiro-Wilk below that
+        if len(resid_arr) >= 20:
+            k2_stat, k2_p = stats.normaltest(resid_arr)
             normality_test = {
-                "test": "Shapiro-Wilk",
-                "statistic": float(shapiro_stat),
-                "p_value": float(shapiro_p),
-                "is_normal": shapiro_p > 0.05
+                "test": "D'Agostino K^2",
+                "statistic": float(k2_stat),
+                "p_value": float(k2_p),
+                "is_normal": bool(k2_p > 0.05)
             }
         else:
-            # Kolmogorov-Smirnov test (for larger samples)
-            ks_stat, ks_p = stats.kstest(residuals, 'norm')
+            shapiro_stat, shapiro_p = stats.shapiro(resid_arr)
             normality_test = {
-                "test": "Kolmogorov-Smirnov",
-                "statistic": float(ks_stat),
-                "p_value": float(ks_p),
-                "is_normal": ks_p > 0.05
+                "test": "Shapiro-Wilk",
+                "statistic": float(shapiro_stat),
+                "p_value": float(shapiro_p),
+                "is_normal": bool(shapiro_p > 0.05)
             }
         
-        # Additional statistics
-        skewness = float(stats.skew(residuals))
-        kurtosis = float(stats.kurtosis(residuals))
+        # Additional statistics from the central moments of one centered copy
+        # (same as stats.skew / stats.kurtosis with their biased defaults)
+        centered = resid_arr - resid_arr.mean()
+        squared = centered * centered
+        m2 = squared.mean()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            skewness = float(np.dot(squared, centered) / len(centered) / m2 ** 1.5)
+            kurtosis = float(np.dot(squared, squared) / len(centered) / (m2 * m2) - 3.0)
         
         return {
             "normality_test": normality_test,
@@ -112,7 +310,7 @@ def check_residual_normality(fitted_model) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Error checking residual normality: {e}")
+        logger.error("Error checking residual normality: %s", e)
         return {"error": str(e)}
 
 
@@ -127,27 +325,51 @@ def validate_forecast_assumptions(data_series: pd.Series) -> Dict[str, Any]:
         Dict with assumption validation results
     """
     try:
+        # Too short to forecast regardless of the values, so skip the reductions
+        n = len(data_series)
+        if n < 10:
+            return {
+                "data_length": n,
+                "sufficient_data": False,
+                "overall_valid": False
+            }
+        
+        arr = np.asarray(data_series.to_numpy(copy=False), dtype=np.float64)
+        nan_mask = np.isnan(arr)
+        missing = int(nan_mask.sum())
+        valid = arr[~nan_mask] if missing else arr
+        count = valid.size
+        
+        # One sweep per statistic over the valid values, NaN when nothing is left
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if count:
+                arr_min = float(valid.min())
+                arr_max = float(valid.max())
+                arr_mean = float(np.add.reduce(valid) / count)
+                centered = valid - arr_mean
+                arr_std = float(np.sqrt(np.dot(centered, centered) / (count - 1))) if count > 1 else float('nan')
+            else:
+                arr_min = arr_max = arr_mean = arr_std = float('nan')
+        
         validation_results = {
-            "data_length": len(data_series),
-            "missing_values": data_series.isnull().sum(),
+            "data_length": n,
+            "missing_values": missing,
             "data_range": {
-                "min": float(data_series.min()),
-                "max": float(data_series.max()),
-                "mean": float(data_series.mean()),
-                "std": float(data_series.std())
+                "min": arr_min,
+                "max": arr_max,
+                "mean": arr_mean,
+                "std": arr_std
             }
         }
         
-        # Check for sufficient data
-        validation_results["sufficient_data"] = len(data_series) >= 10
+        # Sufficient data (short series returned early above)
+        validation_results["sufficient_data"] = True
         
         # Check for reasonable values
-        reasonable_range = (-50 <= data_series.min() <= 50) and (-50 <= data_series.max() <= 50)
-        validation_results["reasonable_values"] = reasonable_range
+        validation_results["reasonable_values"] = (arr_min >= -50) and (arr_max <= 50)
         
         # Check for variance
-        has_variance = data_series.std() > 0.1
-        validation_results["has_variance"] = has_variance
+        validation_results["has_variance"] = arr_std > 0.1
         
         # Overall assessment
         all_checks = [
@@ -162,5 +384,5 @@ def validate_forecast_assumptions(data_series: pd.Series) -> Dict[str, Any]:
         return validation_results
         
     except Exception as e:
-        logger.error(f"Error validating forecast assumptions: {e}")
+        logger.error("Error validating forecast assumptions: %s", e)
         return {"error": str(e)}
\ No newline at end of file
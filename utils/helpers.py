@@ -5,10 +5,97 @@ Common functions used across the Flask application
 
 import requests
 import logging
-from typing import Tuple, Dict, Any
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, Any, Optional, Mapping
+
+# Faster JSON decoding when available; requests' own .json() is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Shared session so geocoding requests reuse one keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'WeatherInsightEngine/1.0'})
+
+# Inclusive upper bound of each US AQI level; values above the last are Hazardous
+AQI_UPPER_BOUNDS = (50, 100, 150, 200, 300)
+
+# Read-only so categorize_air_quality can hand out the same objects
+AQI_LEVELS = tuple(MappingProxyType(level) for level in (
+    {
+        'category': 'Good',
+        'color': 'green',
+        'bg_color': 'bg-green-100',
+        'text_color': 'text-green-800',
+        'description': 'Air quality is satisfactory',
+        'health_advice': 'Enjoy outdoor activities'
+    },
+    {
+        'category': 'Moderate',
+        'color': 'yellow',
+        'bg_color': 'bg-yellow-100',
+        'text_color': 'text-yellow-800',
+        'description': 'Air quality is acceptable',
+        'health_advice': 'Sensitive individuals should limit prolonged outdoor exertion'
+    },
+    {
+        'category': 'Unhealthy for Sensitive Groups',
+        'color': 'orange',
+        'bg_color': 'bg-orange-100',
+        'text_color': 'text-orange-800',
+        'description': 'Sensitive groups may experience minor issues',
+        'health_advice': 'Children, elderly, and people with respiratory conditions should limit outdoor activities'
+    },
+    {
+        'category': 'Unhealthy',
+        'color': 'red',
+        'bg_color': 'bg-red-100',
+        'text_color': 'text-red-800',
+        'description': 'Everyone may experience health effects',
+        'health_advice': 'Limit outdoor activities, especially prolonged exertion'
+    },
+    {
+        'category': 'Very Unhealthy',
+        'color': 'purple',
+        'bg_color': 'bg-purple-100',
+        'text_color': 'text-purple-800',
+        'description': 'Health warnings of emergency conditions',
+        'health_advice': 'Avoid outdoor activities'
+    },
+    {
+        'category': 'Hazardous',
+        'color': 'red',
+        'bg_color': 'bg-red-200',
+        'text_color': 'text-red-900',
+        'description': 'Emergency conditions - health alert',
+        'health_advice': 'Stay indoors and avoid all outdoor activities'
+    },
+))
+
+AQI_UNKNOWN = MappingProxyType({
+    'category': 'Unknown',
+    'color': 'gray',
+    'bg_color': 'bg-gray-100',
+    'text_color': 'text-gray-800',
+    'description': 'Air quality data unavailable',
+    'health_advice': 'Monitor air quality from other sources'
+})
+
+AQI_INVALID = MappingProxyType({
+    'category': 'Invalid',
+    'color': 'gray',
+    'bg_color': 'bg-gray-100',
+    'text_color': 'text-gray-800',
+    'description': 'Invalid AQI value',
+    'health_advice': 'Check data source'
+})
+
 def validate_coordinates(latitude: float, longitude: float) -> bool:
     """
     Validate latitude and longitude coordinates
@@ -40,6 +127,9 @@ def get_location_name(latitude: float, longitude: float) -> str:
     """
     Get a human-readable location name from coordinates using reverse geocoding
     
+    Lookups are cached per coordinate rounded to 3 decimals (~100 m), well
+    below the city-level detail requested from the geocoder.
+    
     Args:
         latitude: Latitude coordinate
         longitude: Longitude coordinate
@@ -48,60 +138,9 @@ def get_location_name(latitude: float, longitude: float) -> str:
         str: Location name or formatted coordinates
     """
     try:
-        # Try reverse geocoding with OpenStreetMap Nominatim (free service)
-        url = f"https://nominatim.openstreetmap.org/reverse"
-        params = {
-            'lat': latitude,
-            'lon': longitude,
-            'format': 'json',
-            'zoom': 10,
-            'addressdetails': 1
-        }
-        
-        headers = {
-            'User-Agent': 'WeatherInsightEngine/1.0'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=5)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Extract meaningful location name
-            address = data.get('address', {})
-            
-            # Priority order for location components
-            location_parts = []
-            
-            # City/town/village
-            city = (address.get('city') or 
-                   address.get('town') or 
-                   address.get('village') or
-                   address.get('municipality'))
-            if city:
-                location_parts.append(city)
-            
-            # State/province
-            state = (address.get('state') or 
-                    address.get('province') or
-                    address.get('region'))
-            if state and state != city:
-                location_parts.append(state)
-            
-            # Country
-            country = address.get('country')
-            if country and len(location_parts) < 2:
-                location_parts.append(country)
-            
-            if location_parts:
-                return ', '.join(location_parts)
-            
-            # Fallback to display name
-            display_name = data.get('display_name', '')
-            if display_name:
-                # Take first few components
-                parts = display_name.split(',')[:3]
-                return ', '.join(part.strip() for part in parts)
+        name = _reverse_geocode(round(float(latitude), 3), round(float(longitude), 3))
+        if name:
+            return name
         
     except Exception as e:
         logger.warning(f"Failed to get location name for {latitude}, {longitude}: {e}")
@@ -110,7 +149,79 @@ def get_location_name(latitude: float, longitude: float) -> str:
     return f"{latitude:.2f}°, {longitude:.2f}°"
 
 
-def categorize_air_quality(aqi: int) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def _reverse_geocode(latitude: float, longitude: float) -> Optional[str]:
+    """
+    Reverse geocode coordinates with OpenStreetMap Nominatim
+    
+    Failed requests raise, so only real answers are cached.
+    
+    Args:
+        latitude: Rounded latitude coordinate
+        longitude: Rounded longitude coordinate
+        
+    Returns:
+        str: Location name, or None if the response has no usable name
+    """
+    # Try reverse geocoding with OpenStreetMap Nominatim (free service)
+    url = f"https://nominatim.openstreetmap.org/reverse"
+    params = {
+        'lat': latitude,
+        'lon': longitude,
+        'format': 'json',
+        'zoom': 10,
+        'addressdetails': 1,
+        # English names for stable output; skip blocks the parser never reads
+        'accept-language': 'en',
+        'namedetails': 0,
+        'extratags': 0
+    }
+    
+    response = _SESSION.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    
+    # Extract meaningful location name
+    address = data.get('address', {})
+    
+    # Priority order for location components
+    location_parts = []
+    
+    # City/town/village
+    city = (address.get('city') or 
+           address.get('town') or 
+           address.get('village') or
+           address.get('municipality'))
+    if city:
+        location_parts.append(city)
+    
+    # State/province
+    state = (address.get('state') or 
+            address.get('province') or
+            address.get('region'))
+    if state and state != city:
+        location_parts.append(state)
+    
+    # Country
+    country = address.get('country')
+    if country and len(location_parts) < 2:
+        location_parts.append(country)
+    
+    if location_parts:
+        return ', '.join(location_parts)
+    
+    # Fallback to display name
+    display_name = data.get('display_name', '')
+    if display_name:
+        # Take first few components
+        parts = display_name.split(',')[:3]
+        return ', '.join(part.strip() for part in parts)
+    
+    return None
+
+
+def categorize_air_quality(aqi: int) -> Mapping[str, Any]:
     """
     Categorize AQI value into health categories with colors and descriptions
     
@@ -118,82 +229,14 @@ def categorize_air_quality(aqi: int) -> Dict[str, Any]:
         aqi: Air Quality Index value
         
     Returns:
-        Dict: AQI category information
+        Mapping: Shared read-only AQI category information (copy with dict() to modify)
     """
     if aqi is None:
-        return {
-            'category': 'Unknown',
-            'color': 'gray',
-            'bg_color': 'bg-gray-100',
-            'text_color': 'text-gray-800',
-            'description': 'Air quality data unavailable',
-            'health_advice': 'Monitor air quality from other sources'
-        }
+        return AQI_UNKNOWN
     
     try:
         aqi_val = int(aqi)
-        
-        if aqi_val <= 50:
-            return {
-                'category': 'Good',
-                'color': 'green',
-                'bg_color': 'bg-green-100',
-                'text_color': 'text-green-800',
-                'description': 'Air quality is satisfactory',
-                'health_advice': 'Enjoy outdoor activities'
-            }
-        elif aqi_val <= 100:
-            return {
-                'category': 'Moderate',
-                'color': 'yellow',
-                'bg_color': 'bg-yellow-100',
-                'text_color': 'text-yellow-800',
-                'description': 'Air quality is acceptable',
-                'health_advice': 'Sensitive individuals should limit prolonged outdoor exertion'
-            }
-        elif aqi_val <= 150:
-            return {
-                'category': 'Unhealthy for Sensitive Groups',
-                'color': 'orange',
-                'bg_color': 'bg-orange-100',
-                'text_color': 'text-orange-800',
-                'description': 'Sensitive groups may experience minor issues',
-                'health_advice': 'Children, elderly, and people with respiratory conditions should limit outdoor activities'
-            }
-        elif aqi_val <= 200:
-            return {
-                'category': 'Unhealthy',
-                'color': 'red',
-                'bg_color': 'bg-red-100',
-                'text_color': 'text-red-800',
-                'description': 'Everyone may experience health effects',
-                'health_advice': 'Limit outdoor activities, especially prolonged exertion'
-            }
-        elif aqi_val <= 300:
-            return {
-                'category': 'Very Unhealthy',
-                'color': 'purple',
-                'bg_color': 'bg-purple-100',
-                'text_color': 'text-purple-800',
-                'description': 'Health warnings of emergency conditions',
-                'health_advice': 'Avoid outdoor activities'
-            }
-        else:
-            return {
-                'category': 'Hazardous',
-                'color': 'red',
-                'bg_color': 'bg-red-200',
-                'text_color': 'text-red-900',
-                'description': 'Emergency conditions - health alert',
-                'health_advice': 'Stay indoors and avoid all outdoor activities'
-            }
-            
     except (ValueError, TypeError):
-        return {
-            'category': 'Invalid',
-            'color': 'gray',
-            'bg_color': 'bg-gray-100',
-            'text_color': 'text-gray-800',
-            'description': 'Invalid AQI value',
-            'health_advice': 'Check data source'
-        }
\ No newline at end of file
+        return AQI_INVALID
+    
+    return AQI_LEVELS[bisect_left(AQI_UPPER_BOUNDS, aqi_val)]